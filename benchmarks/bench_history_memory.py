@@ -0,0 +1,112 @@
+"""
+History memory benchmark.
+
+Builds the same session two ways and measures the memory held per entry
+with tracemalloc:
+- tuples: the old list of 7-tuples (names, signs, score, full emoji
+  verdict string, formatted "%H:%M:%S" time string)
+- columns: love_history.HistoryColumns (interned ids, byte codes)
+- indexed: the same columns plus the indexes the pure-Python filter()
+  builds on its first call (without NumPy)
+
+Names come from a roster with repeats, as new string objects per entry
+(like values read back from an Entry widget).
+
+Usage:
+    python benchmarks/bench_history_memory.py [--rows 100000] [--json]
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from love_core import ZODIAC_SIGNS, fake_vs_real_message, score_pair  # noqa: E402
+from love_history import HistoryColumns  # noqa: E402
+
+
+def _entries(rows: int, seed: int = 5):
+    rng = random.Random(seed)
+    signs = ZODIAC_SIGNS + [""]
+    roster = [f"Person {i}" for i in range(1000)]
+    now = time.time()
+    for i in range(rows):
+        # "".join makes a fresh string object, as Entry.get() would
+        name1 = "".join(rng.choice(roster))
+        name2 = "".join(rng.choice(roster))
+        sign1, sign2 = rng.choice(signs), rng.choice(signs)
+        final, verdict = score_pair(name1, name2, sign1, sign2)[2:4]
+        yield name1, name2, sign1, sign2, final, verdict, now + i
+
+
+def _measure(build, rows: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = build(_entries(rows))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def build_tuples(entries):
+    items = []
+    for name1, name2, sign1, sign2, final, _, ts in entries:
+        time_str = datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S")
+        items.append((name1, name2, sign1, sign2, final, fake_vs_real_message(final), time_str))
+    return items
+
+
+def build_columns(entries):
+    columns = HistoryColumns()
+    for entry in entries:
+        columns.append(*entry)
+    return columns
+
+
+def build_indexed(entries):
+    columns = build_columns(entries)
+    columns._build_name_keys()
+    columns._build_postings()
+    return columns
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    # Generating entries allocates too; measure it alone and subtract it
+    overhead = _measure(lambda entries: sum(1 for _ in entries), args.rows)
+    tuples = _measure(build_tuples, args.rows) - overhead
+    columns = _measure(build_columns, args.rows) - overhead
+    indexed = _measure(build_indexed, args.rows) - overhead
+    results = {
+        "rows": args.rows,
+        "tuples_bytes_per_entry": round(tuples / args.rows, 1),
+        "columns_bytes_per_entry": round(columns / args.rows, 1),
+        "indexed_bytes_per_entry": round(indexed / args.rows, 1),
+        "reduction": round(tuples / columns, 1) if columns > 0 else None,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"tuples:  {results['tuples_bytes_per_entry']:8.1f} bytes/entry")
+        print(f"columns: {results['columns_bytes_per_entry']:8.1f} bytes/entry")
+        print(f"indexed: {results['indexed_bytes_per_entry']:8.1f} bytes/entry (after a pure-Python filter)")
+        print(f"reduction: {results['reduction']}x over {args.rows} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
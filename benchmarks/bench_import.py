@@ -0,0 +1,82 @@
+"""
+Cold-start import benchmark.
+
+Imports each module in a fresh interpreter (so nothing is cached in
+sys.modules) and reports the median import time. Fails if a headless
+module pulls in tkinter or goes over the time budget.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 15] [--max-ms 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module -> must it stay free of tkinter?
+MODULES = {
+    "love_core": True,
+    "love_calculator_app": True,
+    "love_gui": False,
+}
+
+PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - t\n"
+    "print(elapsed * 1000.0, 'tkinter' in sys.modules)\n"
+)
+
+
+def measure(module: str, repeat: int):
+    """Median import time in ms, and whether tkinter got loaded."""
+    times = []
+    loaded_tk = False
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        loaded_tk = loaded_tk or out[1] == "True"
+    return statistics.median(times), loaded_tk
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail if a headless module imports slower than this")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    failed = False
+    for module, headless in MODULES.items():
+        median_ms, loaded_tk = measure(module, args.repeat)
+        results[module] = {"median_ms": round(median_ms, 3), "tkinter": loaded_tk}
+        if headless and loaded_tk:
+            failed = True
+        if headless and args.max_ms is not None and median_ms > args.max_ms:
+            failed = True
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for module, res in results.items():
+            tk_note = "  (loads tkinter)" if res["tkinter"] else ""
+            print(f"{module:<22} {res['median_ms']:8.2f} ms{tk_note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Scaling benchmark for multi-process sharded scoring.
+
+Writes a synthetic JSONL pairs file, scores it with 1, 2, 4, ... worker
+processes (up to the CPU count) and prints rows/sec and speedup per
+worker count.
+
+Usage:
+    python benchmarks/bench_parallel.py [--rows 1000000] [--max-workers N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from love_core import ZODIAC_SIGNS  # noqa: E402
+from love_parallel import score_file_parallel  # noqa: E402
+
+
+def write_pairs(path: str, rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    signs = ZODIAC_SIGNS + [""]
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(rows):
+            fh.write(json.dumps({
+                "name1": f"person{rng.randrange(50_000)}",
+                "name2": f"partner{i}",
+                "sign1": rng.choice(signs),
+                "sign2": rng.choice(signs),
+            }) + "\n")
+
+
+def worker_counts(max_workers: int):
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pairs.jsonl")
+        write_pairs(path, args.rows)
+        for workers in worker_counts(args.max_workers):
+            with open(os.devnull, "wb") as out:
+                start = time.perf_counter()
+                count = score_file_parallel(path, out, "jsonl", "jsonl", workers)
+                elapsed = time.perf_counter() - start
+            results.append({"workers": workers, "rows_per_sec": round(count / elapsed)})
+
+    single = results[0]["rows_per_sec"] or 1
+    for res in results:
+        res["speedup"] = round(res["rows_per_sec"] / single, 2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'workers':>8} {'rows/sec':>12} {'speedup':>8}")
+        for res in results:
+            print(f"{res['workers']:>8} {res['rows_per_sec']:>12,} {res['speedup']:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
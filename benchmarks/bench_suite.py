@@ -0,0 +1,328 @@
+"""
+Benchmark suite for the scoring and history paths.
+
+Runs headless (no tkinter). Each case reports the median time per
+operation over several rounds. Results can be saved as a baseline and
+later runs compared against it; a run fails when any case is slower than
+its baseline by more than the threshold.
+
+Before timing anything, calculate_love_score is checked against the
+original (uncached, per-character) scoring on every code point (in runs
+of 8), on names with a capital sigma and on random mixed-script names;
+any difference fails the run.
+
+Cases:
+- calc_short / calc_long / calc_unicode: calculate_love_score on names
+  not seen before (cold residue cache)
+- calc_cached: calculate_love_score on names already in the cache
+- zodiac_all_pairs: zodiac_compatibility over all 144 sign pairs
+- score_pair: one end-to-end scoring (names + signs)
+- pair_cache_hit: PairCache.lookup for a pair that is already cached
+- batch_rows: score_pairs_batch_codes per row on a large batch
+- history_add: HistoryStore.add per row, including the queued write
+- history_page: one History-tab page read from a large session
+- history_filter: one History-tab filter query (name prefix, sign, score
+  range) over a large session
+
+Usage:
+    python benchmarks/bench_suite.py [--rounds 7] [--json]
+    python benchmarks/bench_suite.py --output results.json --save-baseline baseline.json
+    python benchmarks/bench_suite.py --baseline baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from love_core import (  # noqa: E402
+    ZODIAC_SIGNS,
+    PairCache,
+    calculate_love_score,
+    name_residue,
+    score_pair,
+    score_pairs_batch_codes,
+    zodiac_compatibility,
+)
+from love_history import HistoryColumns, HistoryStore  # noqa: E402
+
+SHORT_NAMES = [("Ann", "Bob"), ("Eve", "Max"), ("Li", "Jo"), ("Sam", "Kai")]
+LONG_NAMES = [
+    ("Alexandria Catherine Montgomery-Smith", "Maximilian Alexander von Habsburg"),
+    ("Bartholomew Jonathan Richardson III", "Evangeline Seraphina Whitmore"),
+]
+UNICODE_NAMES = [("Zoë Ångström", "José Müller"), ("Σοφία Παπαδοπούλου", "Ελένη"),
+                 ("佐藤 花子", "鈴木 太郎"), ("Ирина", "Дмитрий")]
+# Capital sigma lowers to "ς" or "σ" depending on its neighbours
+SIGMA_NAMES = [
+    ("ΣΑΣ", "Bob"), ("ΟΔΥΣΣΕΥΣ", "ΠΗΝΕΛΟΠΗ"), ("Σ", ""), ("aΣ", "b"), ("Σ a", "Σ"),
+    ("ΑΣ", " ΒΣ"), ("ΣΣ", "ΣΣ"), ("ΑΣ", "Α"), ("Α", "ΣΑ"), ("ΑΣ-", "Σ1"),
+]
+
+
+# ----------------------------------------------------------------------
+# SCORE CHECK
+# ----------------------------------------------------------------------
+def reference_score(name1: str, name2: str) -> int:
+    """calculate_love_score as originally written (no residues, no cache)."""
+    combined = (name1 + name2).replace(" ", "").lower()
+    filtered = "".join(ch for ch in combined if ch.isalpha())
+    return sum(ord(ch) for ch in filtered) % 101 if filtered else 0
+
+
+def check_scores(seed: int = 3):
+    """[(name1, name2, score, expected)] where calculate_love_score is wrong."""
+    pairs = list(SIGMA_NAMES) + SHORT_NAMES + LONG_NAMES + UNICODE_NAMES
+    # Every code point, in runs of 8 (a wrong character changes the sum)
+    for start in range(0, 0x110000, 8):
+        run = "".join(map(chr, range(start, start + 8)))
+        pairs.append((run, "A" + run[:1]))
+    rng = random.Random(seed)
+    pool = [chr(code) for code in range(0x600)] + list("ΣσςİẞǅΩ𝔄ﬀ  ")
+    for _ in range(20_000):
+        pairs.append((
+            "".join(rng.choice(pool) for _ in range(rng.randint(0, 6))),
+            "".join(rng.choice(pool) for _ in range(rng.randint(0, 6))),
+        ))
+
+    wrong = []
+    for name1, name2 in pairs:
+        score = calculate_love_score(name1, name2)
+        expected = reference_score(name1, name2)
+        if score != expected:
+            wrong.append((name1, name2, score, expected))
+    name_residue.cache_clear()
+    return wrong
+
+
+def _random_rows(rows: int, seed: int = 11):
+    rng = random.Random(seed)
+    signs = ZODIAC_SIGNS + [""]
+    return (
+        [f"person{rng.randrange(50_000)}" for _ in range(rows)],
+        [f"partner{i}" for i in range(rows)],
+        [rng.choice(signs) for _ in range(rows)],
+        [rng.choice(signs) for _ in range(rows)],
+    )
+
+
+def _time_per_op(fn, ops: int, rounds: int) -> float:
+    """Median seconds per operation; fn() performs `ops` operations."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) / ops)
+    return statistics.median(samples)
+
+
+def _name_case(pairs, loops: int = 2000):
+    """Each round scores names the residue cache has not seen."""
+    # Spaces don't count, so " <n>" variants follow the same normalization path
+    names = [(f"{name1} {i}", f"{name2} {i}") for i in range(loops) for name1, name2 in pairs]
+
+    def run():
+        name_residue.cache_clear()
+        for name1, name2 in names:
+            calculate_love_score(name1, name2)
+
+    return run, len(names)
+
+
+def _cached_name_case(pairs, loops: int = 2000):
+    def run():
+        for _ in range(loops):
+            for name1, name2 in pairs:
+                calculate_love_score(name1, name2)
+
+    return run, loops * len(pairs)
+
+
+def _zodiac_case(loops: int = 50):
+    def run():
+        for _ in range(loops):
+            for sign1 in ZODIAC_SIGNS:
+                for sign2 in ZODIAC_SIGNS:
+                    zodiac_compatibility(sign1, sign2)
+
+    return run, loops * len(ZODIAC_SIGNS) ** 2
+
+
+def _score_pair_case(loops: int = 2000):
+    names1, names2, signs1, signs2 = _random_rows(64)
+    rows = list(zip(names1, names2, signs1, signs2))
+
+    def run():
+        for _ in range(loops // len(rows)):
+            for row in rows:
+                score_pair(*row)
+
+    return run, (loops // len(rows)) * len(rows)
+
+
+def _pair_cache_case(loops: int = 2000):
+    names1, names2, signs1, signs2 = _random_rows(64)
+    rows = list(zip(names1, names2, signs1, signs2))
+    cache = PairCache()
+
+    def run():
+        for _ in range(loops // len(rows)):
+            for row in rows:
+                cache.lookup(*row)
+
+    return run, (loops // len(rows)) * len(rows)
+
+
+def _batch_case(rows: int):
+    columns = _random_rows(rows)
+
+    def run():
+        score_pairs_batch_codes(*columns)
+
+    return run, rows
+
+
+def _filter_case(rows: int):
+    names1, names2, signs1, signs2 = _random_rows(rows)
+    columns = HistoryColumns()
+    now = time.time()
+    for i in range(rows):
+        columns.append(names1[i], names2[i], signs1[i], signs2[i], i % 101, i % 4, now + i)
+    queries = [
+        {"name_prefix": "person1"},
+        {"name_prefix": "person12", "min_score": 50},
+        {"sign": "Leo"},
+        {"min_score": 90, "max_score": 95},
+        {"sign": "Aries", "since": now + rows // 2},
+    ]
+
+    def run():
+        for query in queries:
+            columns.filter(**query)
+
+    return run, len(queries)
+
+
+def bench_history(tmp: str, rows: int, rounds: int):
+    """history_add (per row) and history_page (per page) timings."""
+    add_times = []
+    page_times = []
+    for r in range(rounds):
+        store = HistoryStore(os.path.join(tmp, f"history{r}.db"))
+        try:
+            start = time.perf_counter()
+            for i in range(rows):
+                store.add(f"person{i}", f"partner{i}", "Aries", "Leo", i % 101, i % 4)
+            store.flush()
+            add_times.append((time.perf_counter() - start) / rows)
+
+            pages = 200
+            start = time.perf_counter()
+            for p in range(pages):
+                store.session_rows((p * 997) % max(rows - 10, 1), 10)
+            page_times.append((time.perf_counter() - start) / pages)
+        finally:
+            store.close()
+    return statistics.median(add_times), statistics.median(page_times)
+
+
+def run_suite(rounds: int, batch_rows: int, history_rows: int) -> dict:
+    cases = {
+        "calc_short": _name_case(SHORT_NAMES),
+        "calc_long": _name_case(LONG_NAMES),
+        "calc_unicode": _name_case(UNICODE_NAMES),
+        "calc_cached": _cached_name_case(SHORT_NAMES),
+        "zodiac_all_pairs": _zodiac_case(),
+        "score_pair": _score_pair_case(),
+        "pair_cache_hit": _pair_cache_case(),
+        "batch_rows": _batch_case(batch_rows),
+        "history_filter": _filter_case(history_rows),
+    }
+    results = {}
+    for name, (fn, ops) in cases.items():
+        fn()  # warm-up
+        results[name] = _time_per_op(fn, ops, rounds)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results["history_add"], results["history_page"] = bench_history(
+            tmp, history_rows, max(1, rounds // 2)
+        )
+    return {name: round(seconds * 1e6, 4) for name, seconds in results.items()}
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """[(case, baseline_us, now_us, ratio)] for cases slower than allowed."""
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        ratio = now / before
+        if ratio > 1.0 + threshold:
+            regressions.append((name, before, now, ratio))
+    return regressions
+
+
+def _write_json(path: str, data: dict):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
+        fh.write("\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--batch-rows", type=int, default=100_000)
+    parser.add_argument("--history-rows", type=int, default=20_000)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write results (JSON) to this file")
+    parser.add_argument("--save-baseline", help="write results as the new baseline file")
+    parser.add_argument("--baseline", help="compare against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown vs. baseline, as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    wrong = check_scores()
+    if wrong:
+        for name1, name2, score, expected in wrong[:20]:
+            print(f"WRONG SCORE {name1!r} + {name2!r}: {score} (expected {expected})", file=sys.stderr)
+        print(f"{len(wrong)} pairs scored differently from the reference", file=sys.stderr)
+        return 1
+
+    results = run_suite(args.rounds, args.batch_rows, args.history_rows)
+    report = {"unit": "us_per_op", "python": sys.version.split()[0], "results": results}
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        report["baseline"] = baseline
+        report["regressions"] = [name for name, *_ in regressions]
+
+    if args.output:
+        _write_json(args.output, report)
+    if args.save_baseline:
+        _write_json(args.save_baseline, {"unit": report["unit"], "results": results})
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, us in results.items():
+            line = f"{name:<18} {us:12.4f} us/op"
+            if args.baseline and baseline.get(name):
+                line += f"   ({us / baseline[name]:.2f}x baseline)"
+            print(line)
+    for name, before, now, ratio in regressions:
+        print(f"REGRESSION {name}: {before:.4f} -> {now:.4f} us/op ({ratio:.2f}x)", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Theme-switch latency benchmark.
+
+Opens the app (needs a display), toggles the theme repeatedly and reports
+the median and worst switch time. Fails if the worst switch takes longer
+than one frame (16 ms by default).
+
+Usage:
+    python benchmarks/bench_theme.py [--switches 50] [--max-ms 16]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--switches", type=int, default=50)
+    parser.add_argument("--max-ms", type=float, default=16.0,
+                        help="fail if a theme switch takes longer than this")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    import tkinter as tk
+    from love_gui import LoveCalculatorApp
+    from love_history import HistoryStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = HistoryStore(os.path.join(tmp, "history.db"))
+        try:
+            app = LoveCalculatorApp(history=history)
+        except tk.TclError as exc:
+            # The app never took over the store; close it so tmp can be removed
+            history.close()
+            print(f"error: cannot open the app window ({exc})", file=sys.stderr)
+            return 2
+        app.update()
+
+        times = []
+        for _ in range(args.switches):
+            app.toggle_theme()
+            app.update_idletasks()
+            times.append(app.last_theme_switch_ms)
+        app._on_close()
+
+    results = {
+        "switches": len(times),
+        "median_ms": round(statistics.median(times), 3),
+        "max_ms": round(max(times), 3),
+        "budget_ms": args.max_ms,
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"theme switch: median {results['median_ms']:.3f} ms, "
+              f"max {results['max_ms']:.3f} ms over {results['switches']} switches")
+    return 1 if results["max_ms"] > args.max_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Love Calculator App – shared animation frame clock
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import time
+from tkinter import TclError
+
+
+def _now_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
+class _Animation:
+    __slots__ = ("step", "interval", "due", "group", "on_cancel")
+
+    def __init__(self, step, interval, due, group, on_cancel):
+        self.step = step
+        self.interval = interval
+        self.due = due
+        self.group = group
+        self.on_cancel = on_cancel
+
+
+class FrameClock:
+    """
+    One after() callback per frame drives every active animation.
+    - add(key, step, interval_ms) registers an animation; step() is called
+      every interval_ms and returns False when the animation is finished
+    - Adding an existing key replaces it, so repeated clicks don't stack
+      chains; cancel(key) / cancel_group(group) stop animations early
+    - set_cap(group, n) limits concurrent animations (sprites) in a group;
+      the oldest ones are cancelled first
+    - pause() / resume() stop and restart ticking (e.g. window hidden)
+    Nothing is scheduled while no animation is active.
+    """
+
+    def __init__(self, widget, frame_ms: int = 16):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self.paused = False
+        self._anims = {}
+        self._caps = {}
+        self._after_id = None
+        self._after_due = None
+
+    def __len__(self):
+        return len(self._anims)
+
+    def __contains__(self, key):
+        return key in self._anims
+
+    def pending_callbacks(self) -> int:
+        """Tk after() callbacks the clock currently has scheduled (0 or 1)."""
+        return 1 if self._after_id is not None else 0
+
+    def set_cap(self, group, limit: int):
+        self._caps[group] = limit
+
+    def add(self, key, step, interval_ms: int, delay_ms: int = 0, group=None, on_cancel=None):
+        """Register (or replace) an animation; its first step runs after delay_ms."""
+        if key in self._anims:
+            self.cancel(key)
+        limit = self._caps.get(group)
+        if limit is not None:
+            members = [k for k, anim in self._anims.items() if anim.group == group]
+            for old_key in members[: max(0, len(members) - limit + 1)]:
+                self.cancel(old_key)
+        self._anims[key] = _Animation(step, interval_ms, _now_ms() + delay_ms, group, on_cancel)
+        self._schedule()
+
+    def cancel(self, key):
+        anim = self._anims.pop(key, None)
+        if anim is not None and anim.on_cancel is not None:
+            anim.on_cancel()
+        if not self._anims:
+            self._unschedule()
+
+    def cancel_group(self, group):
+        for key in [k for k, anim in self._anims.items() if anim.group == group]:
+            self.cancel(key)
+
+    def pause(self):
+        self.paused = True
+        self._unschedule()
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        # Pick up where we left off instead of replaying missed frames
+        now = _now_ms()
+        for anim in self._anims.values():
+            anim.due = max(anim.due, now)
+        self._schedule()
+
+    def _tick(self):
+        self._after_id = None
+        self._after_due = None
+        # Everything due within half a frame runs in this same callback
+        now = _now_ms()
+        horizon = now + self.frame_ms / 2
+        for key, anim in list(self._anims.items()):
+            if anim.due > horizon or self._anims.get(key) is not anim:
+                continue
+            try:
+                keep = anim.step()
+            except TclError:
+                # Widget or canvas item gone: drop just this animation
+                keep = False
+            if keep is False:
+                if self._anims.get(key) is anim:
+                    del self._anims[key]
+            else:
+                anim.due = max(anim.due + anim.interval, now)
+        self._schedule()
+
+    def _schedule(self):
+        if self.paused or not self._anims:
+            return
+        due = min(anim.due for anim in self._anims.values())
+        if self._after_id is not None:
+            if self._after_due <= due:
+                return
+            self.widget.after_cancel(self._after_id)
+        delay = max(int(due - _now_ms()), 1)
+        self._after_due = due
+        self._after_id = self.widget.after(delay, self._tick)
+
+    def _unschedule(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+            self._after_due = None
@@ -0,0 +1,249 @@
+"""
+Love Calculator App – history export / import
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import csv
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from love_history import check_row
+from love_stream import _csv_rows
+
+# Every format carries the same fields as a history row
+HISTORY_FIELDS = ("name1", "name2", "sign1", "sign2", "score", "verdict", "ts")
+FORMATS = ("csv", "jsonl", "lhb")
+
+
+def guess_format(path: str) -> str:
+    """Format from the file extension (.csv, .jsonl or .lhb)."""
+    lowered = path.lower()
+    for fmt in FORMATS:
+        if lowered.endswith("." + fmt):
+            return fmt
+    raise ValueError(f"unknown history format for {path!r} (use .csv, .jsonl or .lhb)")
+
+
+# ----------------------------------------------------------------------
+# CSV / JSONL (STREAMING)
+# ----------------------------------------------------------------------
+def write_text_history(rows, stream, fmt: str) -> int:
+    """Write rows to a text stream as CSV or JSONL; returns the row count."""
+    count = 0
+    if fmt == "jsonl":
+        for row in rows:
+            stream.write(json.dumps(dict(zip(HISTORY_FIELDS, row)), ensure_ascii=False) + "\n")
+            count += 1
+    else:
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(HISTORY_FIELDS)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def read_text_history(stream, fmt: str):
+    """Yield history rows from a CSV (with header) or JSONL stream."""
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield check_row(*(record.get(field) for field in HISTORY_FIELDS))
+            except (ValueError, TypeError, AttributeError) as exc:
+                raise ValueError(f"line {line_no}: invalid history row ({exc})") from None
+    else:
+        reader = csv.reader(stream)
+        for row in _csv_rows(reader):
+            if not row or (reader.line_num == 1 and row[0] == HISTORY_FIELDS[0]):
+                continue
+            try:
+                yield check_row(*row)
+            except (ValueError, TypeError) as exc:
+                raise ValueError(f"line {reader.line_num}: invalid history row ({exc})") from None
+
+
+# ----------------------------------------------------------------------
+# BINARY ARCHIVE (FIXED-WIDTH, MEMORY-MAPPED)
+# ----------------------------------------------------------------------
+# Layout (little endian):
+#   header   magic, version, record count, string table offset
+#   records  one fixed-width record per row:
+#            name1, name2, sign1, sign2 (string ids), ts, score, verdict
+#   strings  count, (count + 1) end offsets, UTF-8 bytes of every string
+ARCHIVE_MAGIC = b"LOVEHIST"
+ARCHIVE_VERSION = 1
+HEADER = struct.Struct("<8sIQQ")
+RECORD = struct.Struct("<IIIIdBB2x")
+
+
+def write_archive(rows, path: str) -> int:
+    """
+    Write rows to a .lhb archive in one pass; returns the row count.
+    Strings are interned, so only the distinct names are kept in memory.
+    """
+    ids = {}
+    strings = []
+
+    def intern(text):
+        string_id = ids.get(text)
+        if string_id is None:
+            string_id = ids[text] = len(strings)
+            strings.append(text.encode("utf-8"))
+        return string_id
+
+    count = 0
+    pack = RECORD.pack
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, 0))
+        for name1, name2, sign1, sign2, score, verdict, ts in rows:
+            fh.write(pack(intern(name1), intern(name2), intern(sign1 or ""), intern(sign2 or ""),
+                          float(ts), score, verdict))
+            count += 1
+
+        strings_offset = fh.tell()
+        ends = array("I", [0])
+        end = 0
+        for data in strings:
+            end += len(data)
+            ends.append(end)
+        if sys.byteorder != "little":
+            ends.byteswap()
+        fh.write(struct.pack("<I", len(strings)))
+        fh.write(ends.tobytes())
+        for data in strings:
+            fh.write(data)
+
+        fh.seek(0)
+        fh.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, count, strings_offset))
+    return count
+
+
+class HistoryArchive:
+    """
+    Read-only view of a .lhb archive through mmap.
+    - Rows are unpacked on access (row(i), rows(offset, limit)), so it can
+      back the History tab directly
+    - Strings are decoded the first time a row needs them
+    - Rows are checked like CSV / JSONL rows: ValueError on a bad score,
+      verdict or string id
+    - iter_rows() / iter_pairs() stream everything for import or scoring
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._fh.close()
+            raise ValueError(f"{path}: not a history archive") from None
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a history archive")
+        magic, version, count, strings_offset = HEADER.unpack_from(self._mm, 0)
+        records_end = HEADER.size + count * RECORD.size
+        if (magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION
+                or records_end > strings_offset or strings_offset + 4 > len(self._mm)):
+            self.close()
+            raise ValueError(f"{path}: not a history archive (or truncated)")
+        self.count = count
+
+        (string_count,) = struct.unpack_from("<I", self._mm, strings_offset)
+        self._ends_offset = strings_offset + 4
+        self._data_offset = self._ends_offset + 4 * (string_count + 1)
+        if self._data_offset > len(self._mm):
+            self.close()
+            raise ValueError(f"{path}: not a history archive (or truncated)")
+        self._strings = [None] * string_count
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._mm.close()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def string(self, string_id: int) -> str:
+        """String `string_id` of the table; ValueError if the id or its bytes are bad."""
+        if not 0 <= string_id < len(self._strings):
+            raise ValueError(f"string id {string_id} out of range")
+        text = self._strings[string_id]
+        if text is None:
+            start, end = struct.unpack_from("<II", self._mm, self._ends_offset + 4 * string_id)
+            if not start <= end <= len(self._mm) - self._data_offset:
+                raise ValueError(f"string {string_id} out of range")
+            # A UnicodeDecodeError is a ValueError too
+            text = self._strings[string_id] = str(
+                self._mm[self._data_offset + start:self._data_offset + end], "utf-8"
+            )
+        return text
+
+    def _checked(self, i, name1, name2, sign1, sign2, ts, score, verdict):
+        string = self.string
+        try:
+            return check_row(string(name1), string(name2), string(sign1), string(sign2), score, verdict, ts)
+        except ValueError as exc:
+            raise ValueError(f"{self.path}: record {i}: {exc}") from None
+
+    def row(self, i: int):
+        """(name1, name2, sign1, sign2, score, verdict, ts) for row i."""
+        return self._checked(i, *RECORD.unpack_from(self._mm, HEADER.size + i * RECORD.size))
+
+    def rows(self, offset: int = 0, limit: int = 100):
+        return [self.row(i) for i in range(offset, min(offset + limit, self.count))]
+
+    def iter_rows(self, chunk_rows: int = 4096):
+        """Every row in order, checked like row()."""
+        checked = self._checked
+        for start in range(0, self.count, chunk_rows):
+            begin = HEADER.size + start * RECORD.size
+            end = HEADER.size + min(start + chunk_rows, self.count) * RECORD.size
+            for i, record in enumerate(RECORD.iter_unpack(self._mm[begin:end]), start):
+                yield checked(i, *record)
+
+    def iter_pairs(self):
+        """(name1, name2, sign1, sign2) rows, as read_pairs yields them for scoring."""
+        for row in self.iter_rows():
+            yield row[:4]
+
+
+# ----------------------------------------------------------------------
+# FILE-LEVEL HELPERS
+# ----------------------------------------------------------------------
+def export_history(rows, path: str, fmt=None) -> int:
+    """Write rows to `path` as CSV, JSONL or .lhb (by extension by default)."""
+    fmt = fmt or guess_format(path)
+    if fmt == "lhb":
+        return write_archive(rows, path)
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        return write_text_history(rows, fh, fmt)
+
+
+def iter_history_file(path: str, fmt=None):
+    """Stream history rows from a CSV, JSONL or .lhb file."""
+    fmt = fmt or guess_format(path)
+    if fmt == "lhb":
+        with HistoryArchive(path) as archive:
+            yield from archive.iter_rows()
+    else:
+        with open(path, "r", encoding="utf-8", newline="") as fh:
+            yield from read_text_history(fh, fmt)
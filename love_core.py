@@ -0,0 +1,723 @@
+"""
+Love Calculator App – core scoring (no GUI dependencies)
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import bisect
+import functools
+import heapq
+import time
+from collections import OrderedDict
+
+
+# ----------------------------------------------------------------------
+# NAME NORMALIZATION
+# ----------------------------------------------------------------------
+# "Σ".lower() depends on the neighbouring letters (final sigma), so names
+# containing it cannot be scored independently of each other.
+CAPITAL_SIGMA = "\u03a3"
+
+# Latin-1 names are normalized in C: bytes.translate drops every byte that
+# is not a letter once lowered and lower-cases the rest (Latin-1 letters
+# lower-case to single Latin-1 letters), then sum() adds the codes.
+_LATIN1_LOWER = bytes(ord(chr(code).lower()) for code in range(256))
+_LATIN1_NOT_LETTER = bytes(code for code in range(256) if not chr(code).lower().isalpha())
+
+# Distinct names whose residues are remembered (least recently used go first)
+RESIDUE_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=RESIDUE_CACHE_SIZE)
+def name_residue(name: str) -> int:
+    """
+    Contribution of one name to calculate_love_score:
+    - Same filtering as calculate_love_score
+    - Sum character codes and mod 101
+    For names without a capital sigma:
+    calculate_love_score(a, b) == (name_residue(a) + name_residue(b)) % 101
+    Results are cached per name; see residue_cache_info().
+    """
+    if name.isascii() or max(name) <= "\xff":
+        return sum(name.encode("latin-1").translate(_LATIN1_LOWER, _LATIN1_NOT_LETTER)) % 101
+    # General Unicode: lower() may change length, check letters after it
+    return sum(map(ord, filter(str.isalpha, name.lower()))) % 101
+
+
+def residue_cache_info():
+    """Hits, misses and size of the name residue cache."""
+    return name_residue.cache_info()
+
+
+class RunningResidue:
+    """
+    name_residue of a name as it is being typed.
+    - update(text) compares the new text with the previous one and only
+      subtracts / adds the residue of the edited span (a keystroke, a paste)
+    - Residues are additive over concatenation, so the result equals
+      name_residue(text); names with a capital sigma are recomputed whole
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.residue = 0
+
+    def update(self, text: str) -> int:
+        old = self.text
+        if text == old:
+            return self.residue
+        if CAPITAL_SIGMA in old or CAPITAL_SIGMA in text:
+            self.text = text
+            self.residue = name_residue(text)
+            return self.residue
+
+        # Common prefix and suffix; what lies between was replaced
+        limit = min(len(old), len(text))
+        start = 0
+        while start < limit and old[start] == text[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == text[-1 - end]:
+            end += 1
+        removed = old[start:len(old) - end]
+        inserted = text[start:len(text) - end]
+
+        self.residue = (self.residue - name_residue(removed) + name_residue(inserted)) % 101
+        self.text = text
+        return self.residue
+
+
+# ----------------------------------------------------------------------
+# CORE LOVE SCORE (NAME-BASED)
+# ----------------------------------------------------------------------
+def calculate_love_score(name1: str, name2: str) -> int:
+    """
+    Simple deterministic love score:
+    - Remove spaces, lower case
+    - Keep only alphabetic characters
+    - Sum character codes and mod 101
+    Each name's share comes from name_residue (cached); names with a
+    capital sigma are lowered together since it depends on its neighbours.
+    """
+    if CAPITAL_SIGMA not in name1 and CAPITAL_SIGMA not in name2:
+        return (name_residue(name1) + name_residue(name2)) % 101
+
+    combined = (name1 + name2).replace(" ", "").lower()
+    filtered = "".join(ch for ch in combined if ch.isalpha())
+
+    if not filtered:
+        return 0
+
+    total = sum(ord(ch) for ch in filtered)
+    score = total % 101  # 0–100
+    return score
+
+
+def fake_vs_real_message(score: int) -> str:
+    """
+    Decide the "fake vs real" message based on score.
+    Just for fun – not real relationship science 😄
+    (Looked up in the per-score verdict table built at import.)
+    """
+    return VERDICT_MESSAGES[VERDICT_CODE_BY_SCORE[score_slot(score)]]
+
+
+def advice_for_score(score: int) -> str:
+    """Short advice line for the love report, looked up per score."""
+    return ADVICE_MESSAGES[ADVICE_CODE_BY_SCORE[score_slot(score)]]
+
+
+def score_slot(score) -> int:
+    """Clamp a score into the 0–100 range used by the lookup tables."""
+    score = int(score)
+    if score < 0:
+        return 0
+    if score > 100:
+        return 100
+    return score
+
+
+# ----------------------------------------------------------------------
+# ZODIAC COMPATIBILITY
+# ----------------------------------------------------------------------
+ZODIAC_SIGNS = [
+    "Aries",
+    "Taurus",
+    "Gemini",
+    "Cancer",
+    "Leo",
+    "Virgo",
+    "Libra",
+    "Scorpio",
+    "Sagittarius",
+    "Capricorn",
+    "Aquarius",
+    "Pisces",
+]
+
+ZODIAC_ELEMENT = {
+    "Aries": "Fire",
+    "Leo": "Fire",
+    "Sagittarius": "Fire",
+    "Taurus": "Earth",
+    "Virgo": "Earth",
+    "Capricorn": "Earth",
+    "Gemini": "Air",
+    "Libra": "Air",
+    "Aquarius": "Air",
+    "Cancer": "Water",
+    "Scorpio": "Water",
+    "Pisces": "Water",
+}
+
+
+def zodiac_compatibility(sign1: str, sign2: str):
+    """
+    Simple zodiac compatibility:
+    - If either not selected / invalid: 0 bonus, generic message.
+    - Same sign: +15% bonus
+    - Same element (Fire/Earth/Air/Water): +12%
+    - Complementary elements (Fire-Air, Earth-Water): +8%
+    - Otherwise: +3% small bonus
+    Returns: (bonus, message), looked up in the 14x14 zodiac tables.
+    """
+    idx1 = _sign_slot(sign1)
+    idx2 = _sign_slot(sign2)
+    return (
+        ZODIAC_BONUS_TABLE[idx1][idx2],
+        ZODIAC_MESSAGES[ZODIAC_MESSAGE_TABLE[idx1][idx2]],
+    )
+
+
+def _zodiac_rule(sign1: str, sign2: str):
+    """
+    The compatibility rules behind zodiac_compatibility.
+    Only run at import, to fill the zodiac lookup tables.
+    Returns: (bonus, message)
+    """
+    if not sign1 or not sign2:
+        return 0, "Select both zodiac signs to see star match bonus!"
+
+    if sign1 not in ZODIAC_ELEMENT or sign2 not in ZODIAC_ELEMENT:
+        return 0, "Unknown zodiac sign(s). No star bonus added."
+
+    if sign1 == sign2:
+        return 15, f"{sign1} & {sign2}: Same sign! Strong mutual understanding. 🌟"
+
+    elem1 = ZODIAC_ELEMENT[sign1]
+    elem2 = ZODIAC_ELEMENT[sign2]
+
+    # Same element
+    if elem1 == elem2:
+        return 12, f"{sign1} & {sign2}: Both are {elem1} signs – natural flow and comfort. ✨"
+
+    # Complementary elements
+    complementary_pairs = {
+        ("Fire", "Air"),
+        ("Air", "Fire"),
+        ("Earth", "Water"),
+        ("Water", "Earth"),
+    }
+    if (elem1, elem2) in complementary_pairs:
+        return 8, (
+            f"{sign1} ({elem1}) & {sign2} ({elem2}): Complementary energies – "
+            "good balance when you support each other. 💫"
+        )
+
+    # Everything else
+    return 3, (
+        f"{sign1} ({elem1}) & {sign2} ({elem2}): Different styles, but opposites "
+        "can attract if you communicate well. 💞"
+    )
+
+
+# ----------------------------------------------------------------------
+# PRECOMPUTED RESULT TABLES
+# ----------------------------------------------------------------------
+# Everything a result can show is built once here, so scoring is just a
+# few table gathers returning small integer codes. Strings are looked up
+# only when something is displayed.
+ZODIAC_INDEX = {sign: i for i, sign in enumerate(ZODIAC_SIGNS)}
+
+# Table indices for a missing sign and for a non-empty unknown sign
+NO_SIGN_INDEX = len(ZODIAC_SIGNS)
+UNKNOWN_SIGN_INDEX = NO_SIGN_INDEX + 1
+
+
+def _sign_slot(sign) -> int:
+    """Table index of a sign exactly as given (no whitespace stripping)."""
+    if not sign:
+        return NO_SIGN_INDEX
+    return ZODIAC_INDEX.get(sign, UNKNOWN_SIGN_INDEX)
+
+
+def zodiac_index(sign) -> int:
+    """Table index of a sign after stripping it, like the GUI does."""
+    if not sign:
+        return NO_SIGN_INDEX
+    return _sign_slot(sign.strip())
+
+
+def _build_zodiac_tables():
+    """
+    14x14 bonus and message-id tables (12 signs + no sign + unknown sign).
+    Returns (bonus_table, message_table, messages).
+    """
+    signs = ZODIAC_SIGNS + [None, "?"]
+    message_ids = {}
+    bonus_table = []
+    message_table = []
+    for sign1 in signs:
+        bonus_row = []
+        message_row = []
+        for sign2 in signs:
+            bonus, message = _zodiac_rule(sign1, sign2)
+            bonus_row.append(bonus)
+            message_row.append(message_ids.setdefault(message, len(message_ids)))
+        bonus_table.append(bonus_row)
+        message_table.append(message_row)
+    return bonus_table, message_table, list(message_ids)
+
+
+ZODIAC_BONUS_TABLE, ZODIAC_MESSAGE_TABLE, ZODIAC_MESSAGES = _build_zodiac_tables()
+
+# Verdict codes, lowest to highest: fun, crush, could be real, real love
+VERDICT_THRESHOLDS = (30, 50, 80)
+VERDICT_MESSAGES = [
+    "😂 Mostly for fun (fake meter high)!",
+    "😊 Cute crush vibes. See where it goes.",
+    "💖 Could be real – give it time.",
+    "💘 Looks like REAL love!",
+]
+# Same text without the emoji, as shown in the History tab
+VERDICT_PLAIN = [
+    msg.replace("💘", "").replace("💖", "").replace("😊", "").replace("😂", "")
+    for msg in VERDICT_MESSAGES
+]
+VERDICT_CODE_BY_SCORE = bytes(
+    bisect.bisect_right(VERDICT_THRESHOLDS, score) for score in range(101)
+)
+
+ADVICE_THRESHOLDS = (30, 50, 75, 90)
+ADVICE_MESSAGES = [
+    (
+        "Remember: this is just for fun! Focus on self-love and the right person "
+        "will match your energy. 💫"
+    ),
+    "Cute crush energy. Go slow, be yourself, and see where it goes.",
+    "Nice chemistry! Take time to understand each other and grow together.",
+    "Great connection! Communication and trust will make it even stronger.",
+    "Strong soulmate vibes! Keep nurturing this beautiful bond. 💞",
+]
+ADVICE_CODE_BY_SCORE = bytes(
+    bisect.bisect_right(ADVICE_THRESHOLDS, score) for score in range(101)
+)
+
+# NumPy is optional and only imported by the batch paths the first time
+# they run, so per-pair scoring stays cheap to import.
+_numpy_state = {}
+
+
+def _batch_numpy():
+    """Import NumPy on first use; returns the module, or None if missing."""
+    if "np" not in _numpy_state:
+        try:
+            import numpy
+        except ImportError:
+            # Fallback: batch scoring uses plain Python lists
+            numpy = None
+        else:
+            global _BONUS_ARRAY, _ZODIAC_MESSAGE_ARRAY, _VERDICT_ARRAY
+            _BONUS_ARRAY = numpy.array(ZODIAC_BONUS_TABLE, dtype=numpy.int16)
+            _ZODIAC_MESSAGE_ARRAY = numpy.array(ZODIAC_MESSAGE_TABLE, dtype=numpy.uint8)
+            _VERDICT_ARRAY = numpy.frombuffer(VERDICT_CODE_BY_SCORE, dtype=numpy.uint8)
+        _numpy_state["np"] = numpy
+    return _numpy_state["np"]
+
+
+def score_pair(name1: str, name2: str, sign1=None, sign2=None):
+    """
+    Score one pair the way on_calculate_clicked does.
+    Returns compact codes:
+    (base_score, zodiac_bonus, final_score, verdict_code, zodiac_message_id)
+    Use VERDICT_MESSAGES / ZODIAC_MESSAGES to turn codes into text.
+    """
+    idx1 = zodiac_index(sign1)
+    idx2 = zodiac_index(sign2)
+    base = calculate_love_score(name1, name2)
+    bonus = ZODIAC_BONUS_TABLE[idx1][idx2]
+    final = min(base + bonus, 100)
+    return base, bonus, final, VERDICT_CODE_BY_SCORE[final], ZODIAC_MESSAGE_TABLE[idx1][idx2]
+
+
+def report_line(name1: str, name2: str, sign1, sign2, score: int, msg: str) -> str:
+    """One-line summary of a result, as copied from the love report."""
+    zodiac_part = ""
+    if sign1 or sign2:
+        zodiac_part = f" | Zodiac: {sign1 if sign1 else '?'} & {sign2 if sign2 else '?'}"
+    return f"{name1} ❤️ {name2}{zodiac_part} – Love Score: {score}% | {msg}"
+
+
+# ----------------------------------------------------------------------
+# PAIR RESULT CACHE
+# ----------------------------------------------------------------------
+class PairCache:
+    """
+    Memoized results for repeated pairs, keyed on the stripped
+    (name1, name2, sign1, sign2).
+    - lookup() returns (base, bonus, final, verdict_code, zodiac_msg_id,
+      report_text), scoring the pair on a miss
+    - At most maxsize entries, least recently used evicted first; with
+      ttl (seconds) entries also expire
+    - enabled=False (or maxsize=0) scores every lookup, for benchmarking
+    stats() reports hits, misses, evictions and expirations.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl=None, enabled: bool = True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled and maxsize > 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, name1: str, name2: str, sign1=None, sign2=None):
+        key = (name1.strip(), name2.strip(), (sign1 or "").strip(), (sign2 or "").strip())
+        if self.enabled:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, result = entry
+                if expires is None or expires > time.monotonic():
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return result
+                del self._entries[key]
+                self.expirations += 1
+        self.misses += 1
+
+        result = score_pair(*key)
+        result += (report_line(key[0], key[1], key[2], key[3], result[2], VERDICT_MESSAGES[result[3]]),)
+        if self.enabled:
+            expires = None if self.ttl is None else time.monotonic() + self.ttl
+            self._entries[key] = (expires, result)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_s": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# ----------------------------------------------------------------------
+# BATCH SCORING (HEADLESS)
+# ----------------------------------------------------------------------
+def _exact_final_score(name1: str, name2: str, idx1: int, idx2: int) -> int:
+    """Per-pair final score, used for names the residue shortcut can't handle."""
+    base = calculate_love_score(name1.strip(), name2.strip())
+    return min(base + ZODIAC_BONUS_TABLE[idx1][idx2], 100)
+
+
+def _residue_column(names, cache: dict, irregular: set):
+    """Residues for a column of names, normalizing each distinct name once."""
+    residues = []
+    append = residues.append
+    for name in names:
+        residue = cache.get(name)
+        if residue is None:
+            residue = cache[name] = name_residue(name)
+            if CAPITAL_SIGMA in name:
+                irregular.add(name)
+        append(residue)
+    return residues
+
+
+def score_pairs_batch_codes(names1, names2, signs1=None, signs2=None):
+    """
+    Score many (name1, name2, sign1, sign2) rows at once.
+    Gives the same results as score_pair (calculate_love_score +
+    zodiac_compatibility + the clamp to 100 in on_calculate_clicked).
+    - Each distinct name is normalized once (per-name residues)
+    - Everything else is gathers from the precomputed tables
+      (NumPy arrays if installed, plain Python lists otherwise)
+    signs1 / signs2 may be None (no zodiac bonus for any row).
+    Returns columns:
+    (base_scores, zodiac_bonuses, final_scores, verdict_codes, zodiac_message_ids)
+    """
+    np = _batch_numpy()
+    names1 = list(names1)
+    names2 = list(names2)
+    if len(names1) != len(names2):
+        raise ValueError("names1 and names2 must have the same length")
+    count = len(names1)
+
+    cache = {}
+    irregular = set()
+    res1 = _residue_column(names1, cache, irregular)
+    res2 = _residue_column(names2, cache, irregular)
+    idx1 = [NO_SIGN_INDEX] * count if signs1 is None else [zodiac_index(s) for s in signs1]
+    idx2 = [NO_SIGN_INDEX] * count if signs2 is None else [zodiac_index(s) for s in signs2]
+    if len(idx1) != count or len(idx2) != count:
+        raise ValueError("sign columns must match the number of names")
+
+    if np is not None:
+        sign_rows = np.array(idx1, dtype=np.intp)
+        sign_cols = np.array(idx2, dtype=np.intp)
+        base = (np.array(res1, dtype=np.int16) + np.array(res2, dtype=np.int16)) % 101
+        bonus = _BONUS_ARRAY[sign_rows, sign_cols]
+        final = np.minimum(base + bonus, 100)
+        message_ids = _ZODIAC_MESSAGE_ARRAY[sign_rows, sign_cols]
+    else:
+        bonus_table = ZODIAC_BONUS_TABLE
+        base = [(r1 + r2) % 101 for r1, r2 in zip(res1, res2)]
+        bonus = [bonus_table[i1][i2] for i1, i2 in zip(idx1, idx2)]
+        final = [min(b + z, 100) for b, z in zip(base, bonus)]
+        message_ids = [ZODIAC_MESSAGE_TABLE[i1][i2] for i1, i2 in zip(idx1, idx2)]
+
+    # Rare rows with a capital sigma go through the exact per-pair path
+    if irregular:
+        for row, (name1, name2) in enumerate(zip(names1, names2)):
+            if name1 in irregular or name2 in irregular:
+                base[row] = calculate_love_score(name1.strip(), name2.strip())
+                final[row] = min(base[row] + bonus[row], 100)
+
+    if np is not None:
+        base = base.astype(np.uint8)
+        bonus = bonus.astype(np.uint8)
+        final = final.astype(np.uint8)
+        verdicts = _VERDICT_ARRAY[final]
+    else:
+        verdicts = [VERDICT_CODE_BY_SCORE[score] for score in final]
+    return base, bonus, final, verdicts, message_ids
+
+
+def score_pairs_batch(names1, names2, signs1=None, signs2=None):
+    """
+    Final scores only, for many rows (see score_pairs_batch_codes).
+    Returns a NumPy uint8 array, or a list of ints without NumPy.
+    """
+    return score_pairs_batch_codes(names1, names2, signs1, signs2)[2]
+
+
+# ----------------------------------------------------------------------
+# ALL-PAIRS SCORE MATRIX
+# ----------------------------------------------------------------------
+def _roster_columns(names, signs):
+    """Residues, sign indices and sigma rows for one roster (each name once)."""
+    names = list(names)
+    residues = [name_residue(name) for name in names]
+    if signs is None:
+        sign_idx = [NO_SIGN_INDEX] * len(names)
+    else:
+        sign_idx = [zodiac_index(sign) for sign in signs]
+        if len(sign_idx) != len(names):
+            raise ValueError("sign column must match the number of names")
+    irregular = [i for i, name in enumerate(names) if CAPITAL_SIGMA in name]
+    return names, residues, sign_idx, irregular
+
+
+def iter_score_matrix(names_a, names_b, signs_a=None, signs_b=None, chunk_cells=1 << 22):
+    """
+    Build the N x M matrix of final scores for two rosters, in row chunks.
+    - Every name is normalized exactly once
+    - Rows are built by broadcasting roster A residues against roster B
+    - Only about chunk_cells scores are held in memory at a time
+    Yields (row_start, block); block is a uint8 NumPy array of shape
+    (rows, M), or a list of bytes rows without NumPy.
+    """
+    np = _batch_numpy()
+    names_a, res_a, idx_a, irr_a = _roster_columns(names_a, signs_a)
+    names_b, res_b, idx_b, irr_b = _roster_columns(names_b, signs_b)
+    rows_total, cols = len(names_a), len(names_b)
+    if cols == 0:
+        return
+    chunk_rows = max(1, chunk_cells // cols)
+    irr_a_set = set(irr_a)
+
+    if np is not None:
+        ra = np.array(res_a, dtype=np.int16)
+        rb = np.array(res_b, dtype=np.int16)
+        sa = np.array(idx_a, dtype=np.intp)
+        sb = np.array(idx_b, dtype=np.intp)
+
+    for start in range(0, rows_total, chunk_rows):
+        stop = min(start + chunk_rows, rows_total)
+        if np is not None:
+            block = (ra[start:stop, None] + rb[None, :]) % 101
+            block += _BONUS_ARRAY[sa[start:stop, None], sb[None, :]]
+            np.minimum(block, 100, out=block)
+            block = block.astype(np.uint8)
+        else:
+            block = []
+            for r1, i1 in zip(res_a[start:stop], idx_a[start:stop]):
+                bonus_row = ZODIAC_BONUS_TABLE[i1]
+                block.append(bytearray(
+                    min((r1 + r2) % 101 + bonus_row[i2], 100)
+                    for r2, i2 in zip(res_b, idx_b)
+                ))
+
+        # Rows / columns with a capital sigma use the exact per-pair path
+        if irr_a or irr_b:
+            for row in range(start, stop):
+                cols_to_fix = range(cols) if row in irr_a_set else irr_b
+                for col in cols_to_fix:
+                    block[row - start][col] = _exact_final_score(
+                        names_a[row], names_b[col], idx_a[row], idx_b[col]
+                    )
+
+        if np is None:
+            block = [bytes(row) for row in block]
+        yield start, block
+
+
+def write_score_matrix(path, names_a, names_b, signs_a=None, signs_b=None, chunk_cells=1 << 22):
+    """
+    Write the all-pairs score matrix to `path` as raw row-major uint8.
+    The file is filled chunk by chunk, so the dense matrix is never held
+    in RAM. Read it back with numpy.memmap(path, dtype="uint8", shape=shape).
+    Returns shape (N, M).
+    """
+    np = _batch_numpy()
+    names_a = list(names_a)
+    names_b = list(names_b)
+    shape = (len(names_a), len(names_b))
+    chunks = iter_score_matrix(names_a, names_b, signs_a, signs_b, chunk_cells)
+
+    if np is not None and shape[0] and shape[1]:
+        out = np.memmap(path, dtype=np.uint8, mode="w+", shape=shape)
+        for start, block in chunks:
+            out[start:start + len(block)] = block
+        out.flush()
+        del out
+    else:
+        with open(path, "wb") as fh:
+            for _, block in chunks:
+                fh.writelines(block)
+    return shape
+
+
+# ----------------------------------------------------------------------
+# PARTNER INDEX (TOP-K MATCHES)
+# ----------------------------------------------------------------------
+class PartnerIndex:
+    """
+    Roster index for "best matches for this name" queries.
+    Entries are bucketed by (name residue, sign index). A query scores each
+    non-empty bucket once (at most 101 x 14 of them: 12 signs plus no sign
+    and unknown sign, as in the zodiac tables) instead of every entry, so
+    lookups don't grow with the roster size.
+    Names with a capital sigma are kept aside and scored exactly.
+    """
+
+    def __init__(self):
+        self._next_id = 0
+        # entry_id -> (name, sign, bucket key or None)
+        self._entries = {}
+        # (residue, sign index) -> {entry_id: None}, ids in insertion order
+        self._buckets = {}
+        # entry_id -> sign index, for capital-sigma names
+        self._irregular = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._entries
+
+    def add(self, name: str, sign=None) -> int:
+        """Insert a roster entry and return its id."""
+        entry_id = self._next_id
+        self._next_id += 1
+
+        sign_idx = zodiac_index(sign)
+        if CAPITAL_SIGMA in name:
+            key = None
+            self._irregular[entry_id] = sign_idx
+        else:
+            key = (name_residue(name), sign_idx)
+            self._buckets.setdefault(key, {})[entry_id] = None
+
+        self._entries[entry_id] = (name, sign, key)
+        return entry_id
+
+    def remove(self, entry_id: int):
+        """Delete a roster entry (KeyError if it is not in the index)."""
+        key = self._entries.pop(entry_id)[2]
+        if key is None:
+            del self._irregular[entry_id]
+            return
+        bucket = self._buckets[key]
+        del bucket[entry_id]
+        if not bucket:
+            del self._buckets[key]
+
+    def top_matches(self, name: str, sign=None, k: int = 10):
+        """
+        Return up to k entries with the highest final score against `name`.
+        Result: list of (final_score, entry_id, name, sign), best first;
+        ties are broken by insertion order.
+        """
+        if k <= 0:
+            return []
+
+        sign_idx = zodiac_index(sign)
+        if CAPITAL_SIGMA in name:
+            # Query name itself is context dependent: score every entry exactly
+            scored = [
+                (_exact_final_score(name, other, sign_idx, zodiac_index(other_sign)), entry_id)
+                for entry_id, (other, other_sign, _) in self._entries.items()
+            ]
+            return self._finish(heapq.nsmallest(k, ((-sc, eid) for sc, eid in scored)))
+
+        residue = name_residue(name)
+        bonus_row = ZODIAC_BONUS_TABLE[sign_idx]
+
+        by_score = {}
+        for (other_residue, other_sign), bucket in self._buckets.items():
+            score = min((residue + other_residue) % 101 + bonus_row[other_sign], 100)
+            by_score.setdefault(score, []).append(bucket)
+
+        best = []
+        for score in sorted(by_score, reverse=True):
+            for entry_id in heapq.merge(*by_score[score]):
+                best.append((-score, entry_id))
+                if len(best) >= k:
+                    break
+            if len(best) >= k:
+                break
+
+        for entry_id, other_sign in self._irregular.items():
+            other = self._entries[entry_id][0]
+            best.append((-_exact_final_score(name, other, sign_idx, other_sign), entry_id))
+
+        best.sort()
+        return self._finish(best[:k])
+
+    def _finish(self, ranked):
+        return [
+            (-neg_score, entry_id) + self._entries[entry_id][:2]
+            for neg_score, entry_id in ranked
+        ]
@@ -0,0 +1,1666 @@
+"""
+Love Calculator App – Tkinter GUI
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import base64
+import datetime
+import random
+import sqlite3
+import threading
+import time
+import os
+
+from love_core import (
+    CAPITAL_SIGMA,
+    VERDICT_MESSAGES,
+    VERDICT_PLAIN,
+    ZODIAC_MESSAGES,
+    ZODIAC_SIGNS,
+    PairCache,
+    RunningResidue,
+    _batch_numpy,
+    advice_for_score,
+    calculate_love_score,
+    zodiac_compatibility,
+)
+from love_anim import FrameClock
+from love_archive import export_history, iter_history_file
+from love_history import HistoryStore
+from love_media import DEFAULT_FRAME_BUDGET, FrameCache, GifFrameLoader
+from love_metrics import UiProfiler
+from love_sound import play_error_sound, play_success_sound
+
+# File types offered by History export / import
+HISTORY_FILE_TYPES = [
+    ("CSV", "*.csv"),
+    ("JSON Lines", "*.jsonl"),
+    ("History archive", "*.lhb"),
+]
+
+# Most hearts floating at once, however fast Calculate is clicked
+MAX_HEARTS = 24
+
+# History filter runs this long after the last keystroke
+HISTORY_FILTER_DELAY_MS = 150
+
+# Longest an export waits for queued history rows to reach the database
+HISTORY_FLUSH_TIMEOUT_S = 10
+
+# Live score preview runs this long after the last change to the inputs
+PREVIEW_DELAY_MS = 100
+
+# Calculator labels before a result is calculated
+FAKE_REAL_PLACEHOLDER = "Fake vs Real meter will appear here."
+ZODIAC_PLACEHOLDER = "Zodiac match bonus will appear here."
+
+
+def parse_filter_time(text: str, end: bool = False):
+    """
+    Timestamp for a History time filter, or None if `text` is empty or not
+    understood.
+    - "HH:MM" / "HH:MM:SS" is today; "YYYY-MM-DD" / "YYYY-MM-DD HH:MM" a date
+    - end=True gives the end of that minute / second / day (an exclusive bound)
+    """
+    text = text.strip()
+    if not text:
+        return None
+    formats = (
+        ("%H:%M:%S", datetime.timedelta(seconds=1)),
+        ("%H:%M", datetime.timedelta(minutes=1)),
+        ("%Y-%m-%d %H:%M", datetime.timedelta(minutes=1)),
+        ("%Y-%m-%d", datetime.timedelta(days=1)),
+    )
+    for fmt, step in formats:
+        try:
+            moment = datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if not fmt.startswith("%Y"):
+            moment = datetime.datetime.combine(datetime.date.today(), moment.time())
+        if end:
+            moment += step
+        return moment.timestamp()
+    return None
+
+
+# ----------------------------------------------------------------------
+# VIRTUALIZED HISTORY VIEW
+# ----------------------------------------------------------------------
+class VirtualTreeview:
+    """
+    Shows a long list in a ttk.Treeview while keeping only the visible
+    window of rows as Tk items.
+    - fetch(offset, limit) pages rows in from the model as you scroll
+    - total() gives the model's row count
+    - render(row) turns a model row into the Treeview values
+    Scrolling only rewrites the values of the few existing items, so the
+    selection is kept as a model index and moved with its row; Up / Down
+    at the edge of the window scroll it.
+    """
+
+    def __init__(self, tree, scrollbar, fetch, total, render, visible_rows: int = 10):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fetch = fetch
+        self.total = total
+        self.render = render
+        self.visible_rows = visible_rows
+        self.offset = 0
+        self.dirty = True
+        # Model index of the selected row, and the items refresh() selected
+        self.selected = None
+        self._shown_selection = ()
+
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        tree.bind("<Configure>", self._on_resize)
+        tree.bind("<Map>", lambda e: self.dirty and self.refresh())
+        tree.bind("<<TreeviewSelect>>", self._on_select)
+        tree.bind("<Up>", lambda e: self._on_arrow(-1))
+        tree.bind("<Down>", lambda e: self._on_arrow(1))
+
+    def refresh(self):
+        """Re-read the visible window from the model."""
+        self.dirty = False
+        total = self.total()
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        rows = self.fetch(self.offset, self.visible_rows) if total else []
+
+        items = self.tree.get_children()
+        for i, row in enumerate(rows):
+            if i < len(items):
+                self.tree.item(items[i], values=self.render(row))
+            else:
+                self.tree.insert("", "end", values=self.render(row))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        self._show_selection(len(rows))
+
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(rows)) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def invalidate(self):
+        """Model changed: refresh now if visible, otherwise when shown."""
+        self.dirty = True
+        if self.tree.winfo_ismapped():
+            self.refresh()
+
+    def reset(self):
+        """Model was cleared: back to the top, dropping the few live items."""
+        self.offset = 0
+        self.selected = None
+        self.invalidate()
+
+    def scroll_by(self, rows: int):
+        self.offset = max(0, self.offset + rows)
+        self.refresh()
+        return "break"
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.total())
+            self.refresh()
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def _show_selection(self, shown_rows: int):
+        """Select the item now showing the selected row (or none if it is scrolled away)."""
+        position = None if self.selected is None else self.selected - self.offset
+        if position is not None and 0 <= position < shown_rows:
+            item = self.tree.get_children()[position]
+            shown = (item,)
+            self.tree.focus(item)
+        else:
+            shown = ()
+        self._shown_selection = shown
+        if tuple(self.tree.selection()) != shown:
+            self.tree.selection_set(shown)
+
+    def _on_select(self, event=None):
+        selection = tuple(self.tree.selection())
+        if selection == self._shown_selection:
+            # The selection refresh() made
+            return
+        items = self.tree.get_children()
+        if selection and selection[0] in items:
+            self.selected = self.offset + items.index(selection[0])
+        else:
+            self.selected = None
+        self._shown_selection = selection
+
+    def _on_arrow(self, step: int):
+        items = self.tree.get_children()
+        focus = self.tree.focus()
+        if focus not in items:
+            return None
+        position = items.index(focus) + step
+        if 0 <= position < len(items):
+            # Inside the window: the Treeview moves the selection itself
+            return None
+        index = self.offset + position
+        if 0 <= index < self.total():
+            self.selected = index
+            self.scroll_by(step)
+        return "break"
+
+    def _on_wheel(self, event):
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_resize(self, event):
+        # Heading ~25 px, rows use the Treeview rowheight (22 px)
+        rows = max(1, (event.height - 25) // 22)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.refresh()
+
+
+# ----------------------------------------------------------------------
+# LOVE REPORT POPUP
+# ----------------------------------------------------------------------
+class LoveReportWindow:
+    """
+    The love report popup, built once and reused.
+    - show() only updates texts (and colors when the theme changed)
+    - Close (or the window manager's close button) hides the window
+    The number of widgets stays the same however many reports are shown.
+    """
+
+    def __init__(self, master, copy_command):
+        self.master = master
+        self.copy_command = copy_command
+        self._theme = None
+        self._copy_args = None
+
+        self.window = tk.Toplevel(master)
+        self.window.withdraw()
+        self.window.title("Love Report")
+        self.window.transient(master)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+
+        self.container = tk.Frame(self.window)
+        self.container.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.title_label = tk.Label(
+            self.container,
+            text="💌 Love Report",
+            font=("Segoe UI", 14, "bold"),
+        )
+        self.title_label.pack(pady=(0, 8))
+
+        self.names_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 12, "bold"),
+        )
+        self.names_label.pack(pady=(0, 4))
+
+        self.sign_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 10),
+        )
+        self.sign_label.pack(pady=2)
+
+        self.score_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 10),
+            justify="center",
+        )
+        self.score_label.pack(pady=4)
+
+        self.meter_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 11),
+            wraplength=300,
+            justify="center",
+        )
+        self.meter_label.pack(pady=2)
+
+        self.zodiac_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 9, "italic"),
+            wraplength=300,
+            justify="center",
+        )
+        self.zodiac_label.pack(pady=(4, 6))
+
+        self.advice_label = tk.Label(
+            self.container,
+            font=("Segoe UI", 9, "italic"),
+            wraplength=300,
+            justify="center",
+        )
+        self.advice_label.pack(pady=(4, 8))
+
+        # Buttons frame
+        self.btn_frame = tk.Frame(self.container)
+        self.btn_frame.pack(side="bottom", fill="x", pady=(10, 0))
+
+        copy_btn = ttk.Button(
+            self.btn_frame,
+            text="Copy Result",
+            command=self._copy,
+        )
+        copy_btn.pack(side="left", padx=(0, 5))
+
+        close_btn = ttk.Button(
+            self.btn_frame,
+            text="Close",
+            command=self.hide,
+        )
+        close_btn.pack(side="right")
+
+        self._text_labels = (
+            self.names_label,
+            self.sign_label,
+            self.score_label,
+            self.meter_label,
+            self.zodiac_label,
+            self.advice_label,
+        )
+
+    def _apply_theme(self, theme: dict):
+        card_bg = theme["card"]
+        fg = theme["fg"]
+        self.container.configure(bg=card_bg)
+        self.btn_frame.configure(bg=card_bg)
+        self.title_label.configure(bg=card_bg, fg=theme["accent"])
+        for label in self._text_labels:
+            label.configure(bg=card_bg, fg=fg)
+        self._theme = theme
+
+    def show(self, theme, name1, name2, sign1, sign2, base_score, zodiac_bonus,
+             final_score, msg, zodiac_msg, advice):
+        if theme is not self._theme:
+            self._apply_theme(theme)
+
+        if sign1 or sign2:
+            sign_text = f"Zodiac: {sign1 if sign1 else '?'} & {sign2 if sign2 else '?'}"
+        else:
+            sign_text = "Zodiac: Not selected"
+
+        self.names_label.configure(text=f"{name1} ❤️ {name2}")
+        self.sign_label.configure(text=sign_text)
+        self.score_label.configure(
+            text=(
+                f"Base Name Score: {base_score} %\n"
+                f"Zodiac Bonus: +{zodiac_bonus} %\n"
+                f"Final Love Score: {final_score} %"
+            )
+        )
+        self.meter_label.configure(text=msg)
+        self.zodiac_label.configure(text=zodiac_msg)
+        self.advice_label.configure(text=advice)
+        self._copy_args = (name1, name2, sign1, sign2)
+
+        # Center slightly above main window
+        master = self.master
+        master.update_idletasks()
+        x = master.winfo_x() + (master.winfo_width() // 2) - 160
+        y = master.winfo_y() + (master.winfo_height() // 2) - 140
+        self.window.geometry(f"340x280+{x}+{y}")
+
+        self.window.deiconify()
+        self.window.lift()
+        self.window.grab_set()
+
+    def hide(self):
+        self.window.grab_release()
+        self.window.withdraw()
+
+    def _copy(self):
+        if self._copy_args is not None:
+            self.copy_command(*self._copy_args)
+
+    def widget_count(self) -> int:
+        """Widgets in the popup, including the window itself."""
+        count = 0
+        stack = [self.window]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
+
+
+# ----------------------------------------------------------------------
+# MAIN APP
+# ----------------------------------------------------------------------
+class LoveCalculatorApp(tk.Tk):
+    # Hot paths timed when the app runs with profile=True
+    PROFILED_METHODS = (
+        "on_calculate_clicked",
+        "update_preview",
+        "_apply_theme",
+        "show_love_report",
+        "start_heart_animation",
+        "animate_background",
+    )
+
+    def __init__(self, history=None, bg_cache_budget: int = DEFAULT_FRAME_BUDGET, profile: bool = False,
+                 pair_cache=None):
+        super().__init__()
+
+        # Opt-in profiling: methods are wrapped before any widget binds them
+        self.profiler = None
+        if profile:
+            self.profiler = UiProfiler(self)
+            self.profiler.instrument(self, self.PROFILED_METHODS)
+            self.profiler.start()
+
+        self.title("Love Calculator – by Aravindkumar")
+        self.geometry("620x420")
+        self.resizable(False, False)
+
+        # Fullscreen state
+        self.is_fullscreen = False
+
+        # Theme definitions
+        self.themes = {
+            "light": {
+                "bg": "#f7f7ff",
+                "fg": "#222222",
+                "accent": "#ff4d6a",
+                "card": "#ffffff",
+                "entry_bg": "#ffffff",
+            },
+            "dark": {
+                "bg": "#15151e",
+                "fg": "#f0f0f5",
+                "accent": "#ff4d6a",
+                "card": "#1f1f2b",
+                "entry_bg": "#2a2a3a",
+            },
+        }
+        self.current_theme = "light"
+        # Widgets by theme role, filled in while the UI is built
+        self._themed = {}
+        self._role_options = {name: self._theme_options(theme) for name, theme in self.themes.items()}
+        self.last_theme_switch_ms = 0.0
+
+        # Results of recently scored pairs (PairCache(enabled=False) turns it off)
+        self.pair_cache = pair_cache if pair_cache is not None else PairCache()
+
+        # Persistent history (SQLite); rows are written by a background thread
+        self.history = history if history is not None else self._open_history()
+
+        # One frame clock drives the background, hearts and result pulse
+        self.clock = FrameClock(self)
+        self.clock.set_cap("hearts", MAX_HEARTS)
+
+        # Background image / animated wallpaper frames, decoded on demand
+        # and kept within a memory budget
+        self.bg_frames = FrameCache(self._decode_background_frame, bg_cache_budget)
+        self.bg_frame_index = 0
+        self._load_background_frames()
+
+        self._setup_styles()
+        self._build_ui()
+        self._apply_theme()
+
+        # Start background animation (if frames available)
+        if len(self.bg_frames):
+            self._start_background_animation()
+
+        # Keyboard shortcuts for fullscreen
+        self.bind("<F11>", self._toggle_fullscreen_event)
+        self.bind("<Escape>", self._exit_fullscreen_event)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Love report popup: built once at idle, then hidden and reused
+        self.report_window = None
+        self.report_opens = 0
+        self.report_last_open_ms = 0.0
+        self.report_max_open_ms = 0.0
+        self.after_idle(self._build_report_window)
+
+        # Pause animations while minimized or away from the Calculator tab
+        self.bind("<Unmap>", self._update_animation_pause)
+        self.bind("<Map>", self._update_animation_pause)
+        self.notebook.bind("<<NotebookTabChanged>>", self._update_animation_pause)
+        self.notebook.bind("<<NotebookTabChanged>>", self._refresh_analytics_if_shown, add="+")
+
+    def _open_history(self) -> HistoryStore:
+        """The history file, or an in-memory store (with a warning) if it can't be opened."""
+        try:
+            return HistoryStore()
+        except sqlite3.Error as exc:
+            warning = f"Could not open the history file ({exc}).\nHistory will be kept for this session only."
+            self.after_idle(lambda: messagebox.showwarning("History", warning))
+            return HistoryStore(":memory:")
+
+    def _update_animation_pause(self, event=None):
+        if event is not None and event.widget not in (self, self.notebook):
+            return
+        hidden = self.state() == "iconic" or self.notebook.select() != str(self.calc_frame)
+        if hidden:
+            self.clock.pause()
+        else:
+            self.clock.resume()
+
+    def _on_close(self):
+        # Let the history writer finish what is queued before exiting
+        self.history.close()
+        if self.profiler is not None:
+            self.profiler.stop()
+        self.destroy()
+
+    def profile_summary(self) -> dict:
+        """Timing summary when profiling is on (empty otherwise)."""
+        if self.profiler is None:
+            return {}
+        summary = self.profiler.summary()
+        summary["frame_clock"] = {"animations": len(self.clock), "pending_after": self.clock.pending_callbacks()}
+        return summary
+
+    # ------------------------------------------------------------------
+    # BACKGROUND IMAGE / ANIMATED WALLPAPER
+    # ------------------------------------------------------------------
+    def _load_background_frames(self):
+        """
+        Start loading the background wallpaper if available.
+        Expected files in same folder:
+        - 'love_bg.gif' (animated): split in one pass on a worker thread;
+          frames are added as they arrive and the first one shows at once
+        - 'love_bg.png' (static): fallback
+        """
+        # Try animated GIF first
+        gif_path = "love_bg.gif"
+
+        if os.path.exists(gif_path):
+            self._gif_loader = GifFrameLoader(gif_path)
+            self.after(0, self._collect_background_frames)
+            return
+
+        self._load_static_background()
+
+    def _load_static_background(self):
+        png_path = "love_bg.png"
+        if os.path.exists(png_path):
+            try:
+                with open(png_path, "rb") as fh:
+                    self.bg_frames.add_encoded(base64.b64encode(fh.read()))
+                self.bg_frames.get(0)
+            except (OSError, tk.TclError):
+                self.bg_frames = FrameCache(self._decode_background_frame, self.bg_frames.budget_bytes)
+
+    @staticmethod
+    def _decode_background_frame(data):
+        return tk.PhotoImage(data=data)
+
+    def _collect_background_frames(self):
+        """Queue GIF frames from the loader thread; decoding happens on demand."""
+        for data in self._gif_loader.poll():
+            self.bg_frames.add_encoded(data)
+            if len(self.bg_frames) == 1:
+                # First frame: show it right away
+                self._start_background_animation()
+
+        if not self._gif_loader.finished:
+            self.after(15, self._collect_background_frames)
+        elif not len(self.bg_frames):
+            # GIF unreadable: fall back to the static image
+            self._load_static_background()
+            if len(self.bg_frames):
+                self._start_background_animation()
+
+    def _start_background_animation(self):
+        """Show the current frame now, then advance it on the frame clock."""
+        if "background" in self.clock:
+            return
+        if self.animate_background():
+            # Adjust speed here (in ms). 80–120 looks nice.
+            self.clock.add("background", self.animate_background, 100, delay_ms=100)
+
+    def animate_background(self):
+        """
+        Animate the background by cycling through GIF frames.
+        Only affects the Calculator tab background label.
+        Frames come from the frame cache; the next few are decoded at idle.
+        Called by the frame clock; returns False to stop.
+        """
+        count = len(self.bg_frames)
+        if not count or not hasattr(self, "calc_bg_label"):
+            return False
+
+        try:
+            frame = self.bg_frames.get(self.bg_frame_index)
+        except tk.TclError:
+            frame = None
+        if frame is not None:
+            self.calc_bg_label.configure(image=frame)
+            self.calc_bg_label.image = frame  # keep reference
+
+        self.bg_frame_index = (self.bg_frame_index + 1) % count
+        if count > 1:
+            self.after_idle(self._prefetch_background, self.bg_frame_index)
+        return True
+
+    def _prefetch_background(self, index):
+        try:
+            self.bg_frames.prefetch(index)
+        except tk.TclError:
+            pass
+
+    def background_cache_stats(self) -> dict:
+        """Hit/miss and memory statistics of the background frame cache."""
+        return self.bg_frames.stats()
+
+    # ------------------------------------------------------------------
+    # UI BUILDING
+    # ------------------------------------------------------------------
+    def _build_ui(self):
+        # Top bar with title, theme switch, fullscreen
+        self._register_themed(self, "window")
+        top_bar = tk.Frame(self)
+        top_bar.pack(fill="x", pady=(5, 0), padx=8)
+
+        self.title_label = tk.Label(
+            top_bar,
+            text="❤️  Love Calculator  ❤️",
+            font=("Segoe UI", 18, "bold"),
+        )
+        self.title_label.pack(side="left")
+        self._register_themed(self.title_label, "title")
+
+        self.theme_button = ttk.Button(
+            top_bar,
+            text="Switch to Dark Theme",
+            command=self.toggle_theme,
+        )
+        self.theme_button.pack(side="right")
+
+        self.fullscreen_button = ttk.Button(
+            top_bar,
+            text="Go Fullscreen",
+            command=self.toggle_fullscreen,
+        )
+        self.fullscreen_button.pack(side="right", padx=(5, 0))
+
+        # Notebook for multiple "pages"
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True, padx=8, pady=8)
+
+        # Tabs
+        self.calc_frame = tk.Frame(self.notebook, bd=0, highlightthickness=0)
+        self.history_frame = tk.Frame(self.notebook, bd=0, highlightthickness=0)
+        self.analytics_frame = tk.Frame(self.notebook, bd=0, highlightthickness=0)
+        self.about_frame = tk.Frame(self.notebook, bd=0, highlightthickness=0)
+
+        self.notebook.add(self.calc_frame, text="Calculator")
+        self.notebook.add(self.history_frame, text="History")
+        self.notebook.add(self.analytics_frame, text="Analytics")
+        self.notebook.add(self.about_frame, text="About")
+
+        self._build_calc_tab()
+        self._build_history_tab()
+        self._build_analytics_tab()
+        self._build_about_tab()
+
+        for frame in (self.calc_frame, self.history_frame, self.analytics_frame, self.about_frame):
+            self._register_themed(frame, "page")
+            self._register_theme_tree(frame)
+
+    def _build_calc_tab(self):
+        # Background image label for animated wallpaper
+        # This fills the whole calculator tab
+        self.calc_bg_label = tk.Label(self.calc_frame)
+        self.calc_bg_label.place(
+            relx=0.5, rely=0.5, anchor="center", relwidth=1, relheight=1
+        )
+
+        # Card-style container on top of background
+        card = tk.Frame(self.calc_frame, bd=0, highlightthickness=0)
+        card.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.96, relheight=0.9)
+
+        # Name inputs
+        input_frame = tk.Frame(card)
+        input_frame.pack(pady=10, fill="x", padx=10)
+
+        self.your_name_label = tk.Label(
+            input_frame,
+            text="Your Name:",
+            font=("Segoe UI", 11),
+        )
+        self.your_name_label.grid(row=0, column=0, sticky="w", pady=4)
+
+        self.your_name_var = tk.StringVar()
+        self.your_name_entry = tk.Entry(
+            input_frame,
+            textvariable=self.your_name_var,
+            font=("Segoe UI", 11),
+        )
+        self.your_name_entry.grid(row=0, column=1, sticky="ew", pady=4, padx=(5, 0))
+
+        self.partner_name_label = tk.Label(
+            input_frame,
+            text="Partner's Name:",
+            font=("Segoe UI", 11),
+        )
+        self.partner_name_label.grid(row=1, column=0, sticky="w", pady=4)
+
+        self.partner_name_var = tk.StringVar()
+        self.partner_name_entry = tk.Entry(
+            input_frame,
+            textvariable=self.partner_name_var,
+            font=("Segoe UI", 11),
+        )
+        self.partner_name_entry.grid(row=1, column=1, sticky="ew", pady=4, padx=(5, 0))
+
+        input_frame.columnconfigure(1, weight=1)
+
+        # Zodiac dropdowns
+        zodiac_frame = tk.Frame(card)
+        zodiac_frame.pack(pady=(0, 10), fill="x", padx=10)
+
+        zodiac_label_you = tk.Label(
+            zodiac_frame,
+            text="Your Zodiac Sign:",
+            font=("Segoe UI", 10),
+        )
+        zodiac_label_you.grid(row=0, column=0, sticky="w", pady=3)
+
+        self.zodiac1_var = tk.StringVar(value="")
+        self.zodiac1_combo = ttk.Combobox(
+            zodiac_frame,
+            textvariable=self.zodiac1_var,
+            values=ZODIAC_SIGNS,
+            state="readonly",
+            width=16,
+        )
+        self.zodiac1_combo.grid(row=0, column=1, sticky="w", padx=(5, 15), pady=3)
+
+        zodiac_label_partner = tk.Label(
+            zodiac_frame,
+            text="Partner's Zodiac Sign:",
+            font=("Segoe UI", 10),
+        )
+        zodiac_label_partner.grid(row=1, column=0, sticky="w", pady=3)
+
+        self.zodiac2_var = tk.StringVar(value="")
+        self.zodiac2_combo = ttk.Combobox(
+            zodiac_frame,
+            textvariable=self.zodiac2_var,
+            values=ZODIAC_SIGNS,
+            state="readonly",
+            width=16,
+        )
+        self.zodiac2_combo.grid(row=1, column=1, sticky="w", padx=(5, 15), pady=3)
+
+        # Live preview: score and meter follow the inputs as they change
+        self._name_residues = (RunningResidue(), RunningResidue())
+        self._preview_job = None
+        # (inputs, final score, verdict text, zodiac text) of the last Calculate
+        self._committed_result = None
+        for var in (self.your_name_var, self.partner_name_var, self.zodiac1_var, self.zodiac2_var):
+            var.trace_add("write", self._schedule_preview)
+
+        # Buttons
+        button_frame = tk.Frame(card)
+        button_frame.pack(pady=8)
+
+        self.calculate_button = ttk.Button(
+            button_frame,
+            text="Calculate Love 💝",
+            command=self.on_calculate_clicked,
+        )
+        self.calculate_button.grid(row=0, column=0, padx=5)
+
+        self.clear_button = ttk.Button(
+            button_frame,
+            text="Clear",
+            command=self.clear_inputs,
+        )
+        self.clear_button.grid(row=0, column=1, padx=5)
+
+        # Result section
+        result_frame = tk.Frame(card)
+        result_frame.pack(pady=10, fill="x", padx=10)
+
+        self.result_label = tk.Label(
+            result_frame,
+            text="Love Score: -- %",
+            font=("Segoe UI", 14, "bold"),
+        )
+        self.result_label.pack(pady=4)
+
+        # Progress bar as love meter
+        self.love_meter = ttk.Progressbar(
+            result_frame,
+            orient="horizontal",
+            mode="determinate",
+            maximum=100,
+            length=360,
+        )
+        self.love_meter.pack(pady=4)
+
+        self.fake_real_label = tk.Label(
+            result_frame,
+            text=FAKE_REAL_PLACEHOLDER,
+            font=("Segoe UI", 11),
+        )
+        self.fake_real_label.pack(pady=6)
+
+        self.zodiac_result_label = tk.Label(
+            result_frame,
+            text=ZODIAC_PLACEHOLDER,
+            font=("Segoe UI", 10, "italic"),
+            wraplength=560,
+            justify="center",
+        )
+        self.zodiac_result_label.pack(pady=(0, 6))
+
+        # Heart animation canvas (extra visuals)
+        self.heart_canvas = tk.Canvas(
+            card,
+            bd=0,
+            highlightthickness=0,
+            height=120,
+        )
+        self.heart_canvas.pack(fill="x", padx=10, pady=(0, 10))
+
+        self.note_label = tk.Label(
+            card,
+            text=(
+                "Note: This is just for fun. Real relationships need trust, "
+                "respect, communication… and not only zodiac signs. 😊"
+            ),
+            font=("Segoe UI", 9, "italic"),
+            wraplength=560,
+            justify="center",
+        )
+        self.note_label.pack(side="bottom", pady=(10, 0))
+
+    def _build_history_tab(self):
+        outer = tk.Frame(self.history_frame)
+        outer.pack(fill="both", expand=True, padx=10, pady=10)
+
+        header = tk.Label(
+            outer,
+            text="History of Checked Pairs",
+            font=("Segoe UI", 13, "bold"),
+        )
+        header.pack(anchor="w", pady=(0, 8))
+
+        # Filter bar: every change re-filters shortly after typing stops
+        filter_row = tk.Frame(outer)
+        filter_row.pack(fill="x", pady=(0, 6))
+
+        self.filter_name_var = tk.StringVar()
+        self.filter_sign_var = tk.StringVar()
+        self.filter_min_var = tk.StringVar()
+        self.filter_max_var = tk.StringVar()
+        self.filter_since_var = tk.StringVar()
+        self.filter_until_var = tk.StringVar()
+
+        tk.Label(filter_row, text="Name:", font=("Segoe UI", 9)).pack(side="left")
+        self.filter_name_entry = tk.Entry(filter_row, textvariable=self.filter_name_var, width=12)
+        self.filter_name_entry.pack(side="left", padx=(2, 8))
+        self.filter_name_entry.bind("<FocusIn>", self._warm_history_filter)
+
+        tk.Label(filter_row, text="Sign:", font=("Segoe UI", 9)).pack(side="left")
+        ttk.Combobox(
+            filter_row,
+            textvariable=self.filter_sign_var,
+            values=[""] + ZODIAC_SIGNS,
+            state="readonly",
+            width=10,
+        ).pack(side="left", padx=(2, 8))
+
+        tk.Label(filter_row, text="Score:", font=("Segoe UI", 9)).pack(side="left")
+        tk.Entry(filter_row, textvariable=self.filter_min_var, width=4).pack(side="left", padx=(2, 0))
+        tk.Label(filter_row, text="–", font=("Segoe UI", 9)).pack(side="left")
+        tk.Entry(filter_row, textvariable=self.filter_max_var, width=4).pack(side="left", padx=(0, 8))
+
+        tk.Label(filter_row, text="Time:", font=("Segoe UI", 9)).pack(side="left")
+        tk.Entry(filter_row, textvariable=self.filter_since_var, width=8).pack(side="left", padx=(2, 0))
+        tk.Label(filter_row, text="–", font=("Segoe UI", 9)).pack(side="left")
+        tk.Entry(filter_row, textvariable=self.filter_until_var, width=8).pack(side="left")
+
+        self.filter_count_label = tk.Label(filter_row, text="", font=("Segoe UI", 9, "italic"))
+        self.filter_count_label.pack(side="right")
+
+        # Row indices matching the filter (None: no filter, show every row)
+        self._history_filter = None
+        self._history_filter_job = None
+        for var in (self.filter_name_var, self.filter_sign_var, self.filter_min_var,
+                    self.filter_max_var, self.filter_since_var, self.filter_until_var):
+            var.trace_add("write", self._schedule_history_filter)
+
+        # Treeview for history (virtualized: only visible rows are Tk items)
+        tree_frame = tk.Frame(outer)
+        tree_frame.pack(fill="both", expand=True, pady=(0, 8))
+
+        columns = ("you", "partner", "sign_you", "sign_partner", "score", "meter", "time")
+        self.history_tree = ttk.Treeview(
+            tree_frame,
+            columns=columns,
+            show="headings",
+            height=10,
+        )
+
+        self.history_tree.heading("you", text="You")
+        self.history_tree.heading("partner", text="Partner")
+        self.history_tree.heading("sign_you", text="Your Sign")
+        self.history_tree.heading("sign_partner", text="Partner Sign")
+        self.history_tree.heading("score", text="Score %")
+        self.history_tree.heading("meter", text="Fake vs Real")
+        self.history_tree.heading("time", text="Time")
+
+        self.history_tree.column("you", width=110)
+        self.history_tree.column("partner", width=110)
+        self.history_tree.column("sign_you", width=90)
+        self.history_tree.column("sign_partner", width=100)
+        self.history_tree.column("score", width=65, anchor="center")
+        self.history_tree.column("meter", width=160)
+        self.history_tree.column("time", width=80)
+
+        history_scroll = ttk.Scrollbar(tree_frame, orient="vertical")
+        history_scroll.pack(side="right", fill="y")
+        self.history_tree.pack(side="left", fill="both", expand=True)
+
+        self.history_view = VirtualTreeview(
+            self.history_tree,
+            history_scroll,
+            fetch=self._history_rows,
+            total=self._history_count,
+            render=self._history_values,
+        )
+        self.history_view.refresh()
+
+        button_row = tk.Frame(outer)
+        button_row.pack(fill="x")
+
+        clear_btn = ttk.Button(
+            button_row,
+            text="Clear History",
+            command=self.clear_history,
+        )
+        clear_btn.pack(side="right")
+
+        self.import_button = ttk.Button(
+            button_row,
+            text="Import…",
+            command=self.load_history,
+        )
+        self.import_button.pack(side="left")
+
+        self.export_button = ttk.Button(
+            button_row,
+            text="Export…",
+            command=self.save_history,
+        )
+        self.export_button.pack(side="left", padx=(5, 0))
+
+    def _build_analytics_tab(self):
+        outer = tk.Frame(self.analytics_frame)
+        outer.pack(fill="both", expand=True, padx=10, pady=10)
+
+        header = tk.Label(
+            outer,
+            text="Analytics of This Session",
+            font=("Segoe UI", 13, "bold"),
+        )
+        header.pack(anchor="w")
+
+        self.analytics_summary_label = tk.Label(outer, text="", font=("Segoe UI", 10))
+        self.analytics_summary_label.pack(anchor="w", pady=(2, 4))
+
+        # Score histogram: one bar per score 0–100, resized on refresh
+        self.histogram_canvas = tk.Canvas(outer, height=90, highlightthickness=0)
+        self.histogram_canvas.pack(fill="x")
+        accent = self.themes[self.current_theme]["accent"]
+        self.histogram_bars = [
+            self.histogram_canvas.create_rectangle(0, 0, 0, 0, fill=accent, outline="")
+            for _ in range(101)
+        ]
+        caption = tk.Label(outer, text="Score distribution (0 – 100 %)", font=("Segoe UI", 8, "italic"))
+        caption.pack(anchor="w", pady=(0, 6))
+
+        bottom = tk.Frame(outer)
+        bottom.pack(fill="both", expand=True)
+
+        verdict_box = tk.Frame(bottom)
+        verdict_box.pack(side="left", fill="y", padx=(0, 10))
+        self.verdict_count_labels = []
+        for text in VERDICT_PLAIN:
+            label = tk.Label(verdict_box, text=text.strip(), font=("Segoe UI", 9), anchor="w")
+            label.pack(anchor="w")
+            self.verdict_count_labels.append(label)
+
+        columns = ("pair", "rows", "score", "bonus")
+        self.pair_tree = ttk.Treeview(bottom, columns=columns, show="headings", height=5)
+        self.pair_tree.heading("pair", text="Zodiac Pair")
+        self.pair_tree.heading("rows", text="Checks")
+        self.pair_tree.heading("score", text="Avg Score")
+        self.pair_tree.heading("bonus", text="Avg Bonus")
+        self.pair_tree.column("pair", width=150)
+        self.pair_tree.column("rows", width=55, anchor="center")
+        self.pair_tree.column("score", width=70, anchor="center")
+        self.pair_tree.column("bonus", width=70, anchor="center")
+        self.pair_tree.pack(side="left", fill="both", expand=True)
+        self.histogram_canvas.bind("<Configure>", self._refresh_analytics_if_shown)
+        self.refresh_analytics()
+
+    def _build_about_tab(self):
+        about_card = tk.Frame(self.about_frame)
+        about_card.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.96, relheight=0.9)
+
+        title = tk.Label(
+            about_card,
+            text="About This App",
+            font=("Segoe UI", 16, "bold"),
+        )
+        title.pack(pady=(10, 5))
+
+        body_text = (
+            "Love Calculator App\n"
+            "Version 1.1.0\n\n"
+            "This fun app lets you enter two names and calculates a playful "
+            "love score along with a “fake vs real love” meter.\n\n"
+            "✨ Features:\n"
+            "• Love percentage calculator (based on names)\n"
+            "• Live score preview while typing\n"
+            "• Zodiac sign based star-match bonus\n"
+            "• Fake vs real love meter\n"
+            "• Dark / Light theme switch\n"
+            "• Sound effects\n"
+            "• History of checked pairs (with zodiac signs)\n"
+            "• Session analytics (score distribution, zodiac pairs)\n"
+            "• Fullscreen mode\n"
+            "• Animated hearts & love report popup\n"
+            "• Animated background wallpaper on calculator tab\n\n"
+            "👨‍💻 Made with ❤️ by Aravindkumar\n"
+        )
+
+        body = tk.Label(
+            about_card,
+            text=body_text,
+            justify="left",
+            font=("Segoe UI", 11),
+            wraplength=560,
+        )
+        body.pack(padx=10, pady=5, anchor="w")
+
+        footer = tk.Label(
+            about_card,
+            text="© 2025 Aravindkumar. All rights reserved.",
+            font=("Segoe UI", 9, "italic"),
+        )
+        footer.pack(side="bottom", pady=10)
+
+    # ------------------------------------------------------------------
+    # THEME HANDLING
+    # ------------------------------------------------------------------
+    def _setup_styles(self):
+        """
+        Configure ttk styles once. Only the notebook background changes
+        with the theme, so each theme gets its own named notebook style
+        and a theme switch just points the notebook at it.
+        """
+        style = ttk.Style(self)
+        style.theme_use("clam")
+
+        style.configure(
+            "TButton",
+            padding=6,
+            font=("Segoe UI", 10, "bold"),
+        )
+        style.configure(
+            "TNotebook.Tab",
+            padding=(12, 5),
+        )
+        style.configure(
+            "TProgressbar",
+        )
+        style.configure(
+            "Treeview",
+            rowheight=22,
+            font=("Segoe UI", 10),
+        )
+        for name, theme in self.themes.items():
+            style.configure(f"{name}.TNotebook", background=theme["bg"])
+
+    def _theme_options(self, theme: dict) -> dict:
+        """Options to configure for each theme role."""
+        bg = theme["bg"]
+        fg = theme["fg"]
+        card_bg = theme["card"]
+        return {
+            "window": {"bg": bg},
+            "title": {"bg": bg, "fg": fg},
+            "page": {"bg": bg},
+            "card": {"bg": card_bg},
+            "text": {"bg": card_bg, "fg": fg},
+            "entry": {"bg": theme["entry_bg"], "fg": fg, "insertbackground": fg},
+        }
+
+    def _register_themed(self, widget, role: str):
+        """Record a widget to be recolored on theme switches."""
+        self._themed.setdefault(role, []).append(widget)
+        return widget
+
+    def _register_theme_tree(self, parent):
+        """
+        Register the plain Tk widgets below `parent` by role (once, after
+        the tab is built):
+        - Frames and the heart canvas take the card color
+        - Labels take card color and text color (not the background label)
+        - Entries take the entry colors
+        """
+        for child in parent.winfo_children():
+            if isinstance(child, tk.Frame):
+                self._register_themed(child, "card")
+                self._register_theme_tree(child)
+            elif isinstance(child, tk.Label):
+                if child is not getattr(self, "calc_bg_label", None):
+                    self._register_themed(child, "text")
+            elif isinstance(child, tk.Entry):
+                self._register_themed(child, "entry")
+            elif isinstance(child, tk.Canvas):
+                self._register_themed(child, "card")
+
+    def _apply_theme(self):
+        """Recolor the registered widgets and switch the notebook style."""
+        options = self._role_options[self.current_theme]
+        for role, widgets in self._themed.items():
+            role_options = options[role]
+            for widget in widgets:
+                try:
+                    widget.configure(**role_options)
+                except tk.TclError:
+                    pass
+        self.notebook.configure(style=f"{self.current_theme}.TNotebook")
+
+    def toggle_theme(self):
+        start = time.perf_counter()
+        self.current_theme = "dark" if self.current_theme == "light" else "light"
+        self._apply_theme()
+
+        if self.current_theme == "dark":
+            self.theme_button.configure(text="Switch to Light Theme")
+        else:
+            self.theme_button.configure(text="Switch to Dark Theme")
+        self.last_theme_switch_ms = (time.perf_counter() - start) * 1000.0
+
+    # ------------------------------------------------------------------
+    # FULLSCREEN HANDLING
+    # ------------------------------------------------------------------
+    def toggle_fullscreen(self):
+        self.is_fullscreen = not self.is_fullscreen
+        self.attributes("-fullscreen", self.is_fullscreen)
+        self._update_fullscreen_button_text()
+
+    def _toggle_fullscreen_event(self, event=None):
+        self.toggle_fullscreen()
+
+    def _exit_fullscreen_event(self, event=None):
+        if self.is_fullscreen:
+            self.is_fullscreen = False
+            self.attributes("-fullscreen", False)
+            self._update_fullscreen_button_text()
+
+    def _update_fullscreen_button_text(self):
+        if self.is_fullscreen:
+            self.fullscreen_button.configure(text="Exit Fullscreen")
+        else:
+            self.fullscreen_button.configure(text="Go Fullscreen")
+
+    # ------------------------------------------------------------------
+    # LOGIC
+    # ------------------------------------------------------------------
+    def _schedule_preview(self, *args):
+        """Debounce: preview once typing pauses, not on every keystroke."""
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(PREVIEW_DELAY_MS, self.update_preview)
+
+    def update_preview(self):
+        """
+        Show the score for the current inputs without committing it:
+        only the score label and love meter change (no report, hearts,
+        sound or history until Calculate). The verdict and zodiac labels
+        show the last calculated result only while the inputs still match
+        it. Each name's residue is updated from the edited characters only.
+        """
+        self._preview_job = None
+        name1 = self.your_name_entry.get()
+        name2 = self.partner_name_entry.get()
+        sign1 = self.zodiac1_var.get().strip()
+        sign2 = self.zodiac2_var.get().strip()
+        residue1 = self._name_residues[0].update(name1)
+        residue2 = self._name_residues[1].update(name2)
+
+        committed = self._committed_result
+        if committed is not None and committed[0] == (name1.strip(), name2.strip(), sign1, sign2):
+            _, final_score, verdict_text, zodiac_text = committed
+            self.result_label.configure(text=f"Love Score: {final_score} %", fg=self._score_color(final_score))
+            self.love_meter["value"] = final_score
+            self.fake_real_label.configure(text=verdict_text)
+            self.zodiac_result_label.configure(text=zodiac_text)
+            return
+        self.fake_real_label.configure(text=FAKE_REAL_PLACEHOLDER)
+        self.zodiac_result_label.configure(text=ZODIAC_PLACEHOLDER)
+
+        if not name1.strip() or not name2.strip():
+            self.result_label.configure(text="Love Score: -- %")
+            self.love_meter["value"] = 0
+            return
+
+        if CAPITAL_SIGMA in name1 or CAPITAL_SIGMA in name2:
+            base_score = calculate_love_score(name1.strip(), name2.strip())
+        else:
+            base_score = (residue1 + residue2) % 101
+        zodiac_bonus = zodiac_compatibility(sign1, sign2)[0]
+        final_score = min(base_score + zodiac_bonus, 100)
+
+        self.result_label.configure(text=f"Love Score: {final_score} %", fg=self.themes[self.current_theme]["fg"])
+        self.love_meter["value"] = final_score
+
+    def _score_color(self, score: int) -> str:
+        theme = self.themes[self.current_theme]
+        return theme["accent"] if score >= 80 else theme["fg"]
+
+    def on_calculate_clicked(self):
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+            self._preview_job = None
+        name1 = self.your_name_entry.get().strip()
+        name2 = self.partner_name_entry.get().strip()
+        sign1 = self.zodiac1_var.get().strip()
+        sign2 = self.zodiac2_var.get().strip()
+
+        if not name1 or not name2:
+            play_error_sound()
+            messagebox.showwarning("Missing info", "Please enter both names.")
+            return
+
+        base_score, zodiac_bonus, final_score, verdict_code, zodiac_msg_id, _ = self.pair_cache.lookup(
+            name1, name2, sign1, sign2
+        )
+        zodiac_msg = ZODIAC_MESSAGES[zodiac_msg_id]
+        msg = VERDICT_MESSAGES[verdict_code]
+
+        self.result_label.configure(text=f"Love Score: {final_score} %")
+        self.love_meter["value"] = final_score
+        self.fake_real_label.configure(text=msg)
+
+        if sign1 and sign2:
+            self.zodiac_result_label.configure(
+                text=f"Zodiac match bonus: +{zodiac_bonus}%\n{zodiac_msg}"
+            )
+        else:
+            self.zodiac_result_label.configure(
+                text="Zodiac match: select both signs to add a star-match bonus to the score. ✨"
+            )
+        self._committed_result = (
+            (name1, name2, sign1, sign2),
+            final_score,
+            self.fake_real_label.cget("text"),
+            self.zodiac_result_label.cget("text"),
+        )
+
+        # Color + pulse for high scores
+        if final_score >= 80:
+            accent = self.themes[self.current_theme]["accent"]
+            self.result_label.configure(fg=accent)
+            self._pulse_result_label()
+        else:
+            # reset to theme default color
+            fg = self.themes[self.current_theme]["fg"]
+            self.result_label.configure(fg=fg)
+
+        # Start heart animation
+        self.start_heart_animation(final_score)
+
+        play_success_sound()
+
+        # Save to history (queued; written to disk in the background)
+        self.history.add(name1, name2, sign1, sign2, final_score, verdict_code)
+        self._refresh_history()
+
+        # Show detailed love report popup
+        self.show_love_report(name1, name2, sign1, sign2, base_score, zodiac_bonus, final_score, msg, zodiac_msg)
+
+    def clear_inputs(self):
+        self.your_name_entry.delete(0, "end")
+        self.partner_name_entry.delete(0, "end")
+        self.zodiac1_var.set("")
+        self.zodiac2_var.set("")
+        self.result_label.configure(text="Love Score: -- %")
+        self.love_meter["value"] = 0
+        self.fake_real_label.configure(text=FAKE_REAL_PLACEHOLDER)
+        self.zodiac_result_label.configure(text=ZODIAC_PLACEHOLDER)
+        self._committed_result = None
+        self.clock.cancel_group("hearts")
+        self.heart_canvas.delete("all")
+
+    def clear_history(self):
+        if not self.history.session_count():
+            messagebox.showinfo("History", "No history to clear.")
+            return
+
+        answer = messagebox.askyesno(
+            "Clear History", "Are you sure you want to clear all history?"
+        )
+        if answer:
+            # O(1): the store starts a new session, the view drops its few items
+            self.history.clear_session()
+            self._history_filter = None if self._history_filter is None else self._filter_history()
+            self.history_view.reset()
+            self._update_filter_count()
+            self._refresh_analytics_if_shown()
+
+    # ------------------------------------------------------------------
+    # HISTORY EXPORT / IMPORT (WORKER THREAD)
+    # ------------------------------------------------------------------
+    def save_history(self):
+        """Save the current session as CSV, JSONL or a binary .lhb archive."""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export History",
+            defaultextension=".csv",
+            filetypes=HISTORY_FILE_TYPES,
+        )
+        if not path:
+            return
+
+        def work():
+            if not self.history.flush(HISTORY_FLUSH_TIMEOUT_S):
+                raise TimeoutError("History is still being saved; please try again.")
+            session = self.history.session
+            return export_history(self.history.iter_rows(session) if session is not None else (), path)
+
+        self._run_history_job("Export", "exported", work)
+
+    def load_history(self):
+        """Append rows from a history file to the current session, streamed."""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Import History",
+            filetypes=HISTORY_FILE_TYPES,
+        )
+        if not path:
+            return
+        self._run_history_job(
+            "Import", "imported", lambda: self.history.import_rows(iter_history_file(path))
+        )
+
+    def _run_history_job(self, title: str, verb: str, work):
+        """Run an export/import off the Tk thread; the History tab refreshes as rows arrive."""
+        job = {"count": None, "error": None}
+        failed_before = self.history.failed_rows
+
+        def run():
+            try:
+                job["count"] = work()
+            except (OSError, ValueError, sqlite3.Error) as exc:
+                job["error"] = str(exc)
+            except Exception as exc:
+                # Reported as well, or the dialog would say "None rows imported"
+                job["error"] = f"Unexpected error: {type(exc).__name__}: {exc}"
+
+        thread = threading.Thread(target=run, name="history-job", daemon=True)
+        self.import_button.state(["disabled"])
+        self.export_button.state(["disabled"])
+        thread.start()
+
+        def poll():
+            self._refresh_history()
+            if thread.is_alive():
+                self.after(100, poll)
+                return
+            self.import_button.state(["!disabled"])
+            self.export_button.state(["!disabled"])
+            if job["error"] is not None:
+                messagebox.showerror(title, job["error"])
+            elif self.history.failed_rows > failed_before:
+                messagebox.showwarning(
+                    title,
+                    f"{job['count']} rows {verb}.\n{self.history.failed_rows - failed_before} rows could "
+                    f"not be saved to the history file ({self.history.last_write_error}).",
+                )
+            else:
+                messagebox.showinfo(title, f"{job['count']} rows {verb}.")
+
+        self.after(100, poll)
+
+    # ------------------------------------------------------------------
+    # HISTORY FILTER
+    # ------------------------------------------------------------------
+    def _history_rows(self, offset: int, limit: int):
+        """One page of the History tab, through the filter when one is set."""
+        if self._history_filter is None:
+            return self.history.session_rows(offset, limit)
+        return self.history.session_rows_at(self._history_filter[offset:offset + limit])
+
+    def _history_count(self) -> int:
+        if self._history_filter is None:
+            return self.history.session_count()
+        return len(self._history_filter)
+
+    def _history_criteria(self) -> dict:
+        """Filter criteria from the filter bar; fields that don't parse are ignored."""
+
+        def score(var):
+            try:
+                return int(var.get())
+            except ValueError:
+                return None
+
+        return {
+            "name_prefix": self.filter_name_var.get().strip(),
+            "sign": self.filter_sign_var.get(),
+            "min_score": score(self.filter_min_var),
+            "max_score": score(self.filter_max_var),
+            "since": parse_filter_time(self.filter_since_var.get()),
+            "until": parse_filter_time(self.filter_until_var.get(), end=True),
+        }
+
+    def _filter_history(self):
+        return self.history.filter_session(**self._history_criteria())
+
+    def _schedule_history_filter(self, *args):
+        """Debounce: re-filter once typing pauses, not on every keystroke."""
+        if self._history_filter_job is not None:
+            self.after_cancel(self._history_filter_job)
+        self._history_filter_job = self.after(HISTORY_FILTER_DELAY_MS, self.apply_history_filter)
+
+    def apply_history_filter(self):
+        self._history_filter_job = None
+        self._history_filter = self._filter_history()
+        self.history_view.reset()
+        self._update_filter_count()
+
+    def _refresh_history(self):
+        """Show rows that were just added, keeping the filter applied to them."""
+        if self._history_filter is not None:
+            self._history_filter = self._filter_history()
+            self._update_filter_count()
+        self.history_view.invalidate()
+        self._refresh_analytics_if_shown()
+
+    def _update_filter_count(self):
+        if self._history_filter is None:
+            self.filter_count_label.configure(text="")
+        else:
+            self.filter_count_label.configure(
+                text=f"{len(self._history_filter)} of {self.history.session_count()}"
+            )
+
+    def _warm_history_filter(self, event=None):
+        # The filter uses NumPy when it is installed; import it before the
+        # first keystroke instead of during it
+        self.after_idle(_batch_numpy)
+
+    # ------------------------------------------------------------------
+    # ANALYTICS
+    # ------------------------------------------------------------------
+    def _refresh_analytics_if_shown(self, event=None):
+        if self.notebook.select() == str(self.analytics_frame):
+            self.refresh_analytics()
+
+    def refresh_analytics(self):
+        """
+        Redraw the Analytics tab from the store's running totals; the cost
+        does not grow with the number of rows.
+        """
+        stats = self.history.session_stats(pairs=12)
+        count = stats["count"]
+        if count:
+            self.analytics_summary_label.configure(
+                text=(
+                    f"{count} checks   mean {stats['mean']:.1f}%   median {stats['median']}%   "
+                    f"p10–p90 {stats['p10']}–{stats['p90']}%   avg bonus +{stats['mean_bonus']:.1f}%"
+                )
+            )
+        else:
+            self.analytics_summary_label.configure(text="No checks in this session yet.")
+
+        canvas = self.histogram_canvas
+        width = max(canvas.winfo_width(), 101)
+        height = int(canvas.cget("height"))
+        tallest = max(stats["histogram"]) or 1
+        for score, (bar, rows) in enumerate(zip(self.histogram_bars, stats["histogram"])):
+            left = score * width / 101
+            top = height - (height - 2) * rows / tallest
+            canvas.coords(bar, left, top, left + width / 101, height)
+
+        for label, text, rows in zip(self.verdict_count_labels, VERDICT_PLAIN, stats["verdicts"]):
+            label.configure(text=f"{text.strip()}  {rows}")
+
+        self.pair_tree.delete(*self.pair_tree.get_children())
+        for sign1, sign2, rows, score, bonus in stats["pairs"]:
+            self.pair_tree.insert(
+                "", "end",
+                values=(f"{sign1 or '-'} & {sign2 or '-'}", rows, f"{score:.1f}", f"+{bonus:.1f}"),
+            )
+
+    def _history_values(self, row):
+        """Treeview values for a stored history row (built only when shown)."""
+        name1, name2, sign1, sign2, score, verdict_code, ts = row
+        return (
+            name1,
+            name2,
+            sign1 if sign1 else "-",
+            sign2 if sign2 else "-",
+            score,
+            VERDICT_PLAIN[verdict_code],
+            datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S"),
+        )
+
+    # ------------------------------------------------------------------
+    # EXTRA VISUALS & ANIMATIONS
+    # ------------------------------------------------------------------
+    def start_heart_animation(self, score: int):
+        """Create floating heart animation on the canvas."""
+        # Replace any hearts still floating from the previous result
+        self.clock.cancel_group("hearts")
+        self.heart_canvas.delete("all")
+
+        # More hearts for higher scores
+        if score >= 80:
+            num_hearts = 16
+        elif score >= 50:
+            num_hearts = 10
+        else:
+            num_hearts = 6
+
+        # Get canvas width (fallback if not yet drawn)
+        width = self.heart_canvas.winfo_width()
+        if width <= 1:
+            width = 560
+
+        for _ in range(num_hearts):
+            x = random.randint(20, width - 20)
+            y = random.randint(70, 110)
+            size = random.randint(16, 26)
+            # Using Unicode heart as text
+            item = self.heart_canvas.create_text(
+                x,
+                y,
+                text="❤",
+                font=("Segoe UI Emoji", size, "bold"),
+            )
+            dy = -random.uniform(1.0, 2.5)
+            steps = random.randint(35, 55)
+            delay = random.randint(0, 300)
+            self.clock.add(
+                ("heart", item),
+                self._heart_stepper(item, dy, steps),
+                40,
+                delay_ms=delay,
+                group="hearts",
+                on_cancel=lambda it=item: self.heart_canvas.delete(it),
+            )
+
+    def _heart_stepper(self, item, dy, steps):
+        """Frame-clock step for one heart: float up, then disappear."""
+        remaining = [steps]
+
+        def step():
+            if remaining[0] <= 0:
+                self.heart_canvas.delete(item)
+                return False
+            self.heart_canvas.move(item, 0, dy)
+            remaining[0] -= 1
+            return True
+
+        return step
+
+    def _pulse_result_label(self):
+        """Simple pulse animation on the result label (restarts if running)."""
+        sizes = iter([16, 18, 16, 14])
+        self.result_label.configure(font=("Segoe UI", 14, "bold"))
+
+        def step():
+            size = next(sizes, None)
+            if size is None:
+                return False
+            self.result_label.configure(font=("Segoe UI", size, "bold"))
+            return True
+
+        self.clock.add(
+            "pulse",
+            step,
+            80,
+            delay_ms=80,
+            on_cancel=lambda: self.result_label.configure(font=("Segoe UI", 14, "bold")),
+        )
+
+    # ------------------------------------------------------------------
+    # LOVE REPORT POPUP
+    # ------------------------------------------------------------------
+    def show_love_report(
+        self,
+        name1: str,
+        name2: str,
+        sign1: str,
+        sign2: str,
+        base_score: int,
+        zodiac_bonus: int,
+        final_score: int,
+        msg: str,
+        zodiac_msg: str,
+    ):
+        """Show the love report popup (built once, then only its text changes)."""
+        start = time.perf_counter()
+        if self.report_window is None:
+            self._build_report_window()
+        self.report_window.show(
+            self.themes[self.current_theme],
+            name1,
+            name2,
+            sign1,
+            sign2,
+            base_score,
+            zodiac_bonus,
+            final_score,
+            msg,
+            zodiac_msg,
+            self._advice_for_score(final_score),
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.report_opens += 1
+        self.report_last_open_ms = elapsed_ms
+        self.report_max_open_ms = max(self.report_max_open_ms, elapsed_ms)
+
+    def _build_report_window(self):
+        if self.report_window is None:
+            self.report_window = LoveReportWindow(self, self._copy_report_to_clipboard)
+
+    def report_stats(self) -> dict:
+        """Open latency of the report popup and how many widgets it holds."""
+        return {
+            "opens": self.report_opens,
+            "last_open_ms": round(self.report_last_open_ms, 3),
+            "max_open_ms": round(self.report_max_open_ms, 3),
+            "widgets": self.report_window.widget_count() if self.report_window is not None else 0,
+        }
+
+    def _copy_report_to_clipboard(self, name1: str, name2: str, sign1: str, sign2: str):
+        # Report text comes with the cached result for this pair
+        text = self.pair_cache.lookup(name1, name2, sign1, sign2)[5]
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+        except tk.TclError:
+            # If clipboard not available, silently ignore
+            pass
+
+    def _advice_for_score(self, score: int) -> str:
+        """Give a short advice line based on score."""
+        return advice_for_score(score)
@@ -0,0 +1,822 @@
+"""
+Love Calculator App – persistent calculation history
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import bisect
+import functools
+import itertools
+import operator
+import os
+import pathlib
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+
+from love_core import VERDICT_CODE_BY_SCORE, VERDICT_MESSAGES, _batch_numpy, zodiac_compatibility
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".love_calculator_history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id      INTEGER PRIMARY KEY,
+    started REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id      INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL,
+    ts      REAL NOT NULL,
+    name1   TEXT NOT NULL,
+    name2   TEXT NOT NULL,
+    sign1   TEXT NOT NULL,
+    sign2   TEXT NOT NULL,
+    score   INTEGER NOT NULL,
+    verdict INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_session ON history(session, id);
+CREATE INDEX IF NOT EXISTS history_name1 ON history(name1);
+CREATE INDEX IF NOT EXISTS history_name2 ON history(name2);
+CREATE INDEX IF NOT EXISTS history_score ON history(score);
+CREATE INDEX IF NOT EXISTS history_ts ON history(ts);
+"""
+
+INSERT_ROW = (
+    "INSERT INTO history (session, ts, name1, name2, sign1, sign2, score, verdict) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Columns returned by every read: (name1, name2, sign1, sign2, score, verdict, ts)
+ROW_COLUMNS = "name1, name2, sign1, sign2, score, verdict, ts"
+
+
+def check_row(name1, name2, sign1, sign2, score, verdict, ts):
+    """
+    Row with the right types; ValueError if a name is missing, the score is
+    out of range or the verdict code doesn't belong to the score.
+    """
+    for name in (name1, name2):
+        if name is None or not str(name).strip():
+            raise ValueError("missing name")
+    score = int(score)
+    verdict = int(verdict)
+    if not 0 <= score <= 100:
+        raise ValueError(f"score {score} out of range")
+    if verdict != VERDICT_CODE_BY_SCORE[score]:
+        raise ValueError(f"verdict code {verdict} does not match score {score}")
+    return (str(name1), str(name2), str(sign1 or ""), str(sign2 or ""), score, verdict, float(ts))
+
+
+# ----------------------------------------------------------------------
+# IN-MEMORY COLUMNS (CURRENT SESSION)
+# ----------------------------------------------------------------------
+class HistoryColumns:
+    """
+    One session's rows kept as typed arrays instead of tuples.
+    - Names and signs are interned: each distinct string is stored once
+      and rows hold its id
+    - Score and verdict code are one byte each, the timestamp is whole
+      seconds
+    About 20 bytes per row; row() rebuilds the tuple only when asked.
+    Indexes for filter() are built by the first filter() call and then
+    kept up to date as rows are appended, so a session that is never
+    filtered doesn't pay for them:
+    - names: sorted case-folded keys (prefix search)
+    - rows per name and per score value (0–100), only for the pure-Python
+      filter (without NumPy); they take about as much again per row
+    - time: rows are usually appended in time order, so the ts column is
+      searched directly; otherwise a sorted order is built on demand
+    """
+
+    def __init__(self):
+        self.strings = []
+        self._string_ids = {}
+        self.signs = []
+        self._sign_ids = {}
+        self.name1 = array("I")
+        self.name2 = array("I")
+        self.sign1 = array("H")
+        self.sign2 = array("H")
+        self.score = array("B")
+        self.verdict = array("B")
+        self.ts = array("q")
+
+        # Built by the first filter(): sorted (case-folded name, string id),
+        # and (without NumPy) name string id -> rows where it is either
+        # partner, rows per score
+        self._name_keys = None
+        self._name_rows = None
+        self._score_rows = None
+        self._ts_sorted = True
+        self._ts_order = None
+
+    def __len__(self):
+        return len(self.score)
+
+    def intern(self, text: str) -> int:
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def _intern_sign(self, sign: str) -> int:
+        sign_id = self._sign_ids.get(sign)
+        if sign_id is None:
+            sign_id = self._sign_ids[sign] = len(self.signs)
+            self.signs.append(sign)
+        return sign_id
+
+    def _index_name(self, string_id: int, row: int):
+        rows = self._name_rows.get(string_id)
+        if rows is None:
+            rows = self._name_rows[string_id] = array("I")
+        if not rows or rows[-1] != row:
+            rows.append(row)
+
+    def _build_name_keys(self):
+        self._name_keys = sorted((text.casefold(), string_id) for string_id, text in enumerate(self.strings))
+
+    def _build_postings(self):
+        self._name_rows = {}
+        self._score_rows = [array("I") for _ in range(101)]
+        index_name = self._index_name
+        for row, (id1, id2, score) in enumerate(zip(self.name1, self.name2, self.score)):
+            index_name(id1, row)
+            index_name(id2, row)
+            self._score_rows[score].append(row)
+
+    def append(self, name1, name2, sign1, sign2, score: int, verdict: int, ts: float):
+        row = len(self.score)
+        known = len(self.strings)
+        id1 = self.intern(name1)
+        id2 = self.intern(name2)
+        self.name1.append(id1)
+        self.name2.append(id2)
+        self.sign1.append(self._intern_sign(sign1))
+        self.sign2.append(self._intern_sign(sign2))
+        self.score.append(score)
+        self.verdict.append(verdict)
+        ts = int(ts)
+        if row and ts < self.ts[-1]:
+            self._ts_sorted = False
+        self.ts.append(ts)
+
+        if self._name_keys is not None:
+            for string_id in range(known, len(self.strings)):
+                bisect.insort(self._name_keys, (self.strings[string_id].casefold(), string_id))
+        if self._name_rows is not None:
+            self._index_name(id1, row)
+            self._index_name(id2, row)
+            self._score_rows[score].append(row)
+        self._ts_order = None
+
+    def row(self, i: int):
+        """(name1, name2, sign1, sign2, score, verdict, ts) for row i."""
+        strings = self.strings
+        signs = self.signs
+        return (
+            strings[self.name1[i]],
+            strings[self.name2[i]],
+            signs[self.sign1[i]],
+            signs[self.sign2[i]],
+            self.score[i],
+            self.verdict[i],
+            self.ts[i],
+        )
+
+    def rows(self, offset: int = 0, limit: int = 100):
+        return [self.row(i) for i in range(offset, min(offset + limit, len(self)))]
+
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (not counting interned strings)."""
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.name1, self.name2, self.sign1, self.sign2, self.score, self.verdict, self.ts)
+        )
+
+    # ------------------------------------------------------------------
+    # FILTERING
+    # ------------------------------------------------------------------
+    def name_ids(self, prefix: str):
+        """String ids of names starting with `prefix` (case-insensitive)."""
+        key = prefix.casefold()
+        if self._name_keys is None:
+            self._build_name_keys()
+        keys = self._name_keys
+        start = bisect.bisect_left(keys, (key,))
+        ids = set()
+        for i in range(start, len(keys)):
+            name, string_id = keys[i]
+            if not name.startswith(key):
+                break
+            ids.add(string_id)
+        return ids
+
+    def _time_rows(self, since, until):
+        """Rows with since <= ts < until, as a range when ts is in order."""
+        lo = -float("inf") if since is None else since
+        hi = float("inf") if until is None else until
+        if self._ts_sorted:
+            return range(bisect.bisect_left(self.ts, lo), bisect.bisect_left(self.ts, hi))
+        if self._ts_order is None:
+            order = sorted(range(len(self.ts)), key=self.ts.__getitem__)
+            self._ts_order = (order, [self.ts[i] for i in order])
+        order, keys = self._ts_order
+        return order[bisect.bisect_left(keys, lo):bisect.bisect_left(keys, hi)]
+
+    def filter(self, name_prefix: str = "", sign: str = "", min_score=None, max_score=None,
+               since=None, until=None, within=None):
+        """
+        Rows matching every given criterion, in insertion order (None when
+        nothing is filtered, meaning all rows).
+        - name_prefix: either partner's name starts with it (any case)
+        - sign: either partner has this sign
+        - min_score / max_score: inclusive; since / until: ts range
+        - within: an earlier result this query narrows, searched instead of
+          the indexes when it is smaller
+        The smallest candidate set (name, score or time index, or `within`)
+        is scanned and the remaining criteria are checked with C-level
+        map()/compress() passes over the columns.
+        """
+        lo = 0 if min_score is None else max(0, min_score)
+        hi = 100 if max_score is None else min(100, max_score)
+        use_score = (lo, hi) != (0, 100)
+        use_time = since is not None or until is not None
+        if not (name_prefix or sign or use_score or use_time):
+            return None
+
+        sign_id = None
+        if sign:
+            sign_id = self._sign_ids.get(sign)
+            if sign_id is None:
+                return array("I")
+        if lo > hi:
+            return array("I")
+        ids = self.name_ids(name_prefix) if name_prefix else None
+        if ids is not None and not ids:
+            return array("I")
+
+        np = _batch_numpy()
+        if np is not None:
+            return self._filter_numpy(np, ids, sign_id, lo, hi, use_score, since, until)
+
+        if self._name_rows is None:
+            self._build_postings()
+        # Candidate sets: (estimated size, criterion it already satisfies,
+        # producer of ascending row indices)
+        total = len(self)
+        candidates = [(total, None, lambda: range(total))]
+        if ids is not None:
+            name_rows = [self._name_rows[i] for i in ids]
+            size = sum(map(len, name_rows))
+            # Merging postings only pays off when they are few; a row can be
+            # listed under both partners' names
+            if size * 8 < total:
+                candidates.append((size, "name", lambda: sorted(set().union(*name_rows))))
+        if use_score:
+            buckets = self._score_rows[lo:hi + 1]
+            candidates.append((sum(map(len, buckets)), "score", lambda: _merge_rows(buckets)))
+        if use_time:
+            time_rows = self._time_rows(since, until)
+            if isinstance(time_rows, range):
+                candidates.append((len(time_rows), "time", lambda: time_rows))
+            else:
+                candidates.append((len(time_rows), "time", lambda: sorted(time_rows)))
+        if within is not None:
+            candidates.append((len(within), None, lambda: within))
+        _, satisfied, producer = min(candidates, key=lambda c: c[0])
+        rows = producer()
+
+        def column(values):
+            if isinstance(rows, range):
+                return values[rows.start:rows.stop]
+            return map(values.__getitem__, rows)
+
+        checks = []
+        if ids is not None and satisfied != "name":
+            wanted = bytearray(len(self.strings))
+            for i in ids:
+                wanted[i] = 1
+            checks.append(map(operator.or_,
+                              map(wanted.__getitem__, column(self.name1)),
+                              map(wanted.__getitem__, column(self.name2))))
+        if sign_id is not None:
+            wanted = bytearray(len(self.signs))
+            wanted[sign_id] = 1
+            checks.append(map(operator.or_,
+                              map(wanted.__getitem__, column(self.sign1)),
+                              map(wanted.__getitem__, column(self.sign2))))
+        if use_score and satisfied != "score":
+            wanted = bytearray(101)
+            wanted[lo:hi + 1] = b"\x01" * (hi - lo + 1)
+            checks.append(map(wanted.__getitem__, column(self.score)))
+        if use_time and satisfied != "time":
+            if since is not None:
+                checks.append(map(functools.partial(operator.le, since), column(self.ts)))
+            if until is not None:
+                checks.append(map(functools.partial(operator.gt, until), column(self.ts)))
+
+        if not checks:
+            return array("I", rows)
+        keep = checks[0]
+        for check in checks[1:]:
+            keep = map(operator.and_, keep, check)
+        return array("I", itertools.compress(rows, keep))
+
+    def _filter_numpy(self, np, ids, sign_id, lo, hi, use_score, since, until):
+        """filter() as whole-column NumPy comparisons (views, no copies)."""
+        total = len(self)
+        start, stop = 0, total
+        if self._ts_sorted and (since is not None or until is not None):
+            # Time range is a slice of the (ordered) ts column
+            time_rows = self._time_rows(since, until)
+            start, stop = time_rows.start, time_rows.stop
+            since = until = None
+        if start >= stop:
+            return array("I")
+
+        def column(values, dtype):
+            return np.frombuffer(values, dtype=dtype, count=stop)[start:]
+
+        mask = np.ones(stop - start, dtype=bool)
+        if ids is not None:
+            wanted = np.zeros(len(self.strings), dtype=bool)
+            wanted[np.fromiter(ids, dtype=np.int64, count=len(ids))] = True
+            mask &= wanted[column(self.name1, np.uint32)] | wanted[column(self.name2, np.uint32)]
+        if sign_id is not None:
+            mask &= (column(self.sign1, np.uint16) == sign_id) | (column(self.sign2, np.uint16) == sign_id)
+        if use_score:
+            score = column(self.score, np.uint8)
+            mask &= (score >= lo) & (score <= hi)
+        if since is not None:
+            mask &= column(self.ts, np.int64) >= since
+        if until is not None:
+            mask &= column(self.ts, np.int64) < until
+
+        result = array("I")
+        result.frombytes((np.flatnonzero(mask) + start).astype(np.uint32).tobytes())
+        return result
+
+
+# ----------------------------------------------------------------------
+# RUNNING ANALYTICS (CURRENT SESSION)
+# ----------------------------------------------------------------------
+class HistoryStats:
+    """
+    Score distribution and counts for a session, kept up to date row by row.
+    - add() is O(1): one histogram bin, one verdict count, one zodiac pair
+    - Totals are integers, so nothing drifts however many rows are added
+    - mean / percentiles are read from the 101-bin histogram
+    A new session starts from a new, empty HistoryStats.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.score_sum = 0
+        self.bonus_sum = 0
+        self.histogram = [0] * 101
+        self.verdicts = [0] * len(VERDICT_MESSAGES)
+        # (sign, sign) in sorted order -> [rows, score sum, bonus sum]
+        self.pairs = {}
+        self._pair_bonus = {}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, score: int, verdict: int, sign1: str, sign2: str):
+        key = (sign1, sign2) if sign1 <= sign2 else (sign2, sign1)
+        bonus = self._pair_bonus.get(key)
+        if bonus is None:
+            bonus = self._pair_bonus[key] = zodiac_compatibility(*key)[0]
+        self.count += 1
+        self.score_sum += score
+        self.bonus_sum += bonus
+        self.histogram[score] += 1
+        self.verdicts[verdict] += 1
+        totals = self.pairs.get(key)
+        if totals is None:
+            self.pairs[key] = [1, score, bonus]
+        else:
+            totals[0] += 1
+            totals[1] += score
+            totals[2] += bonus
+
+    def mean(self):
+        return self.score_sum / self.count if self.count else None
+
+    def percentile(self, pct: float):
+        """Lowest score with at least `pct` percent of rows at or below it."""
+        if not self.count:
+            return None
+        wanted = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for score, rows in enumerate(self.histogram):
+            seen += rows
+            if seen >= wanted:
+                return score
+        return 100
+
+    def pair_averages(self, limit=None):
+        """[(sign1, sign2, rows, mean score, mean bonus)], most frequent pair first."""
+        ranked = sorted(self.pairs.items(), key=lambda item: (-item[1][0], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [
+            (sign1, sign2, rows, score_sum / rows, bonus_sum / rows)
+            for (sign1, sign2), (rows, score_sum, bonus_sum) in ranked
+        ]
+
+    def summary(self, pairs: int = 12) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "median": self.percentile(50),
+            "p10": self.percentile(10),
+            "p25": self.percentile(25),
+            "p75": self.percentile(75),
+            "p90": self.percentile(90),
+            "mean_bonus": self.bonus_sum / self.count if self.count else None,
+            "histogram": list(self.histogram),
+            "verdicts": list(self.verdicts),
+            "pairs": self.pair_averages(pairs),
+        }
+
+
+def _narrows(new, old) -> bool:
+    """True if filter criteria `new` can only match a subset of what `old` matched."""
+    prefix, sign, min_score, max_score, since, until = new
+    old_prefix, old_sign, old_min, old_max, old_since, old_until = old
+
+    def at_least(value, bound):
+        return bound is None or (value is not None and value >= bound)
+
+    def at_most(value, bound):
+        return bound is None or (value is not None and value <= bound)
+
+    return (
+        prefix.startswith(old_prefix)
+        and (not old_sign or sign == old_sign)
+        and at_least(min_score, old_min)
+        and at_most(max_score, old_max)
+        and at_least(since, old_since)
+        and at_most(until, old_until)
+    )
+
+
+def _merge_rows(runs):
+    """Ascending union of disjoint ascending row arrays (sort() merges the runs)."""
+    if len(runs) == 1:
+        return runs[0]
+    merged = []
+    for run in runs:
+        merged.extend(run)
+    merged.sort()
+    return merged
+
+
+# ----------------------------------------------------------------------
+# HISTORY STORE
+# ----------------------------------------------------------------------
+class HistoryStore:
+    """
+    SQLite-backed calculation history (WAL mode).
+    - add() never touches the disk: rows are queued and a writer thread
+      inserts them in batches
+    - Indexed on names, score and timestamp
+    - Every app run (and every clear) that adds rows is a session; past
+      sessions stay queryable
+    - A row the database rejects (or a batch it can't take, e.g. when the
+      disk is full) is counted in failed_rows instead of stopping the writer
+    - path=":memory:" keeps everything in memory; read_only=True only reads
+    The current session is also kept in memory as HistoryColumns, so the
+    History tab reads it without touching the database, and summarized in
+    HistoryStats for the Analytics tab.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, batch_size: int = 256, read_only: bool = False):
+        self.path = path
+        self.batch_size = batch_size
+        self.read_only = read_only
+        self.failed_rows = 0
+        self.last_write_error = None
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._ops = queue.Queue()
+        self.columns = HistoryColumns()
+        self.stats = HistoryStats()
+        # (columns, row count, criteria, result) of the last filter_session()
+        self._last_filter = None
+        self._closed = False
+        # Every thread shares one connection to an in-memory database
+        self._shared = sqlite3.connect(":memory:", check_same_thread=False) if path == ":memory:" else None
+        # The session is created with its first row
+        self.session = None
+        self._writer = None
+        if read_only:
+            # Fail here, not halfway through a read, if the file can't be opened
+            self._conn().execute("SELECT 1 FROM history LIMIT 1")
+            return
+
+        setup = self._connect()
+        try:
+            setup.execute("PRAGMA journal_mode=WAL")
+            setup.executescript(SCHEMA)
+            last = setup.execute("SELECT MAX(id) FROM sessions").fetchone()[0] or 0
+        finally:
+            if setup is not self._shared:
+                setup.close()
+        self._last_session = last
+
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        if self._shared is not None:
+            return self._shared
+        if self.read_only:
+            return sqlite3.connect(pathlib.Path(self.path).resolve().as_uri() + "?mode=ro", uri=True)
+        return sqlite3.connect(self.path)
+
+    # ------------------------------------------------------------------
+    # WRITES (queued)
+    # ------------------------------------------------------------------
+    def add(self, name1, name2, sign1, sign2, score: int, verdict: int, ts=None):
+        """Queue one calculation for the current session."""
+        if ts is None:
+            ts = time.time()
+        sign1 = sign1 or ""
+        sign2 = sign2 or ""
+        with self._lock:
+            session = self._current_session()
+            self.columns.append(name1, name2, sign1, sign2, score, verdict, ts)
+            self.stats.add(score, verdict, sign1, sign2)
+            self._ops.put(("row", (session, ts, name1, name2, sign1, sign2, score, verdict)))
+
+    def import_rows(self, rows, chunk_size: int = 4096) -> int:
+        """
+        Append (name1, name2, sign1, sign2, score, verdict, ts) rows to the
+        current session, consuming `rows` chunk by chunk (any iterator,
+        e.g. a file reader). Returns the number of rows imported.
+        """
+        count = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                count += self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            count += self._import_chunk(chunk)
+        return count
+
+    def _import_chunk(self, chunk) -> int:
+        # Check every row first, so a bad one changes nothing
+        try:
+            chunk = [check_row(*row) for row in chunk]
+        except TypeError as exc:
+            raise ValueError(f"invalid history row ({exc})") from None
+        with self._lock:
+            session = self._current_session()
+            append = self.columns.append
+            add_stats = self.stats.add
+            queued = []
+            for name1, name2, sign1, sign2, score, verdict, ts in chunk:
+                append(name1, name2, sign1, sign2, score, verdict, ts)
+                add_stats(score, verdict, sign1, sign2)
+                queued.append((session, ts, name1, name2, sign1, sign2, score, verdict))
+            self._ops.put(("rows", queued))
+        return len(chunk)
+
+    def clear_session(self):
+        """
+        Start a fresh, empty session; the old session's rows are deleted
+        in the background. Returns immediately.
+        """
+        with self._lock:
+            if self.session is not None:
+                self._ops.put(("delete", self.session))
+                self.session = None
+            self.columns = HistoryColumns()
+            self.stats = HistoryStats()
+
+    def flush(self, timeout=None) -> bool:
+        """Wait until everything queued so far is on disk."""
+        done = threading.Event()
+        self._ops.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write what is still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._ops.put(("stop", None))
+            self._writer.join()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and conn is not self._shared:
+            conn.close()
+        self._local.conn = None
+        if self._shared is not None:
+            self._shared.close()
+
+    def _current_session(self) -> int:
+        # Called with the lock held: the session starts with its first row
+        if self._writer is None:
+            raise ValueError(f"{self.path}: history opened read-only")
+        if self.session is None:
+            session = max(self._last_session + 1, int(time.time() * 1000))
+            self._last_session = session
+            self._ops.put(("session", (session, time.time())))
+            self.session = session
+        return self.session
+
+    def _write_loop(self):
+        conn = self._connect()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            ops = [self._ops.get()]
+            # Drain whatever else is waiting so rows go in as one batch
+            while len(ops) < self.batch_size:
+                try:
+                    ops.append(self._ops.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [value for kind, value in ops if kind == "flush"]
+            running = not any(kind == "stop" for kind, _ in ops)
+            try:
+                self._write_ops(conn, ops)
+            except (UnicodeEncodeError, sqlite3.IntegrityError, sqlite3.InterfaceError):
+                # A row the database won't take: write the batch again one
+                # row at a time so only that row is lost
+                self._write_ops_one_by_one(conn, ops)
+            except sqlite3.Error as exc:
+                # Locked or full database: this batch is lost, later ones may work
+                self._write_failed(exc, ops)
+            finally:
+                for event in events:
+                    event.set()
+        if conn is not self._shared:
+            conn.close()
+
+    def _write_ops(self, conn, ops):
+        rows = []
+        with conn:
+            for kind, value in ops:
+                if kind == "row":
+                    rows.append(value)
+                    continue
+                if kind == "rows":
+                    rows.extend(value)
+                    continue
+                if rows:
+                    conn.executemany(INSERT_ROW, rows)
+                    rows = []
+                if kind == "session":
+                    conn.execute("INSERT OR IGNORE INTO sessions (id, started) VALUES (?, ?)", value)
+                elif kind == "delete":
+                    conn.execute("DELETE FROM history WHERE session = ?", (value,))
+                    conn.execute("DELETE FROM sessions WHERE id = ?", (value,))
+            if rows:
+                conn.executemany(INSERT_ROW, rows)
+
+    def _write_ops_one_by_one(self, conn, ops):
+        for kind, value in ops:
+            if kind == "row":
+                singles = [(kind, value)]
+            elif kind == "rows":
+                singles = [("row", row) for row in value]
+            else:
+                singles = [(kind, value)]
+            for single in singles:
+                try:
+                    self._write_ops(conn, [single])
+                except (UnicodeEncodeError, sqlite3.Error) as exc:
+                    self._write_failed(exc, [single])
+
+    def _write_failed(self, exc, ops):
+        for kind, value in ops:
+            if kind == "row":
+                self.failed_rows += 1
+            elif kind == "rows":
+                self.failed_rows += len(value)
+        self.last_write_error = exc
+
+    # ------------------------------------------------------------------
+    # READS
+    # ------------------------------------------------------------------
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def session_count(self) -> int:
+        """Rows in the current session (including queued ones)."""
+        return len(self.columns)
+
+    def session_stats(self, pairs: int = 12) -> dict:
+        """HistoryStats.summary() of the current session (no rows are scanned)."""
+        with self._lock:
+            return self.stats.summary(pairs)
+
+    def session_rows(self, offset: int = 0, limit: int = 100):
+        """
+        Rows of the current session in insertion order, from memory:
+        [(name1, name2, sign1, sign2, score, verdict, ts), ...]
+        """
+        with self._lock:
+            return self.columns.rows(offset, limit)
+
+    def iter_rows(self, session=None, batch: int = 1000):
+        """
+        Stream rows already on disk (all sessions, or one), oldest first,
+        without loading them all: (name1, name2, sign1, sign2, score, verdict, ts).
+        """
+        if session is None:
+            cursor = self._conn().execute(f"SELECT {ROW_COLUMNS} FROM history ORDER BY id")
+        else:
+            cursor = self._conn().execute(
+                f"SELECT {ROW_COLUMNS} FROM history WHERE session = ? ORDER BY id", (session,)
+            )
+        while True:
+            rows = cursor.fetchmany(batch)
+            if not rows:
+                return
+            yield from rows
+
+    def filter_session(self, name_prefix: str = "", sign: str = "", min_score=None, max_score=None,
+                       since=None, until=None):
+        """
+        Row indices of the current session matching the criteria (see
+        HistoryColumns.filter; None means no filter). A query that narrows
+        the previous one (e.g. one more letter typed) searches only the
+        previous result.
+        """
+        criteria = (name_prefix.casefold(), sign, min_score, max_score, since, until)
+        with self._lock:
+            columns = self.columns
+            within = None
+            last = self._last_filter
+            if last is not None and last[0] is columns and last[1] == len(columns) and last[3] is not None:
+                if _narrows(criteria, last[2]):
+                    within = last[3]
+            result = columns.filter(name_prefix, sign, min_score, max_score, since, until, within)
+            self._last_filter = (columns, len(columns), criteria, result)
+        return result
+
+    def session_rows_at(self, indices):
+        """Rows of the current session at the given row indices."""
+        with self._lock:
+            row = self.columns.row
+            return [row(i) for i in indices]
+
+    def sessions(self):
+        """Past and current sessions on disk: [(session, started, rows), ...]."""
+        return self._conn().execute(
+            "SELECT s.id, s.started, COUNT(h.id) FROM sessions s "
+            "LEFT JOIN history h ON h.session = s.id "
+            "GROUP BY s.id ORDER BY s.id"
+        ).fetchall()
+
+    def query(self, session=None, name=None, min_score=None, max_score=None,
+              since=None, until=None, limit: int = 1000):
+        """
+        Search rows already written to disk (call flush() first to include
+        the latest ones). `name` matches either partner exactly.
+        """
+        clauses = []
+        params = []
+        if session is not None:
+            clauses.append("session = ?")
+            params.append(session)
+        if name is not None:
+            clauses.append("(name1 = ? OR name2 = ?)")
+            params += [name, name]
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("score <= ?")
+            params.append(max_score)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        return self._conn().execute(
+            f"SELECT {ROW_COLUMNS} FROM history {where}ORDER BY id LIMIT ?",
+            params + [limit],
+        ).fetchall()
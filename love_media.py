@@ -0,0 +1,218 @@
+"""
+Love Calculator App – background wallpaper loading
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import base64
+import queue
+import threading
+from collections import OrderedDict
+
+
+# ----------------------------------------------------------------------
+# GIF SPLITTING
+# ----------------------------------------------------------------------
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Position just after a chain of GIF data sub-blocks."""
+    while True:
+        size = data[pos]
+        pos += size + 1
+        if size == 0:
+            return pos
+
+
+def iter_gif_frames(data: bytes):
+    """
+    Split an animated GIF into standalone single-frame GIFs, in one pass.
+    Each frame keeps the file's header, global color table and its own
+    graphic control extension (delay / transparency); the LZW image data
+    is copied as is, so nothing is decoded here.
+    Stops quietly at the trailer or at a truncated block.
+    """
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("not a GIF file")
+
+    flags = data[10]
+    pos = 13
+    if flags & 0x80:
+        pos += 3 * (2 << (flags & 0x07))
+    head = data[:pos]
+    control = b""
+
+    try:
+        while pos < len(data):
+            block = data[pos]
+            if block == 0x3B:  # trailer
+                return
+            if block == 0x21:  # extension
+                end = _skip_sub_blocks(data, pos + 2)
+                if data[pos + 1] == 0xF9:  # graphic control extension
+                    control = data[pos:end]
+                pos = end
+            elif block == 0x2C:  # image descriptor
+                start = pos
+                local_flags = data[pos + 9]
+                pos += 10
+                if local_flags & 0x80:
+                    pos += 3 * (2 << (local_flags & 0x07))
+                pos = _skip_sub_blocks(data, pos + 1)  # +1: LZW code size
+                if pos > len(data):
+                    return
+                yield head + control + data[start:pos] + b";"
+                control = b""
+            else:
+                return
+    except IndexError:
+        # Truncated file: keep the frames we already have
+        return
+
+
+# ----------------------------------------------------------------------
+# OFF-THREAD LOADER
+# ----------------------------------------------------------------------
+class GifFrameLoader:
+    """
+    Reads and splits a GIF on a worker thread (one pass over the file).
+    Frames come out as base64 standalone GIFs, ready for
+    tk.PhotoImage(data=..., format="gif"); the Tk thread picks them up
+    with poll() as they become ready.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.error = None
+        self._frames = queue.Queue()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gif-loader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            with open(self.path, "rb") as fh:
+                data = fh.read()
+            for frame in iter_gif_frames(data):
+                self._frames.put(base64.b64encode(frame))
+        except (OSError, ValueError) as exc:
+            self.error = exc
+        finally:
+            self._done.set()
+
+    def poll(self, limit: int = 4):
+        """Up to `limit` frames that are ready, without blocking."""
+        frames = []
+        while len(frames) < limit:
+            try:
+                frames.append(self._frames.get_nowait())
+            except queue.Empty:
+                break
+        return frames
+
+    @property
+    def finished(self) -> bool:
+        """True once every frame has been handed out by poll()."""
+        return self._done.is_set() and self._frames.empty()
+
+
+# ----------------------------------------------------------------------
+# DECODED FRAME CACHE
+# ----------------------------------------------------------------------
+DEFAULT_FRAME_BUDGET = 64 * 1024 * 1024
+
+
+def _photo_bytes(image) -> int:
+    """Approximate memory of a decoded Tk photo image (32-bit pixels)."""
+    return image.width() * image.height() * 4
+
+
+class FrameCache:
+    """
+    Background frames kept within a memory budget.
+    - Encoded frames (compressed GIF data) are kept for the whole session
+    - Frames are decoded on demand with decode(data) and kept in LRU order
+      while their total size fits in budget_bytes
+    - prefetch(i) decodes frames i .. i+lookahead-1 ahead of the animation
+    stats() reports hits, misses, evictions and memory use.
+    """
+
+    def __init__(self, decode, budget_bytes: int = DEFAULT_FRAME_BUDGET,
+                 lookahead: int = 3, sizeof=_photo_bytes):
+        self.decode = decode
+        self.budget_bytes = budget_bytes
+        self.lookahead = lookahead
+        self.sizeof = sizeof
+
+        self._encoded = []
+        # index -> (image, bytes), least recently used first
+        self._decoded = OrderedDict()
+        self.decoded_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._encoded)
+
+    def add_encoded(self, data):
+        """Append the next frame (not decoded yet)."""
+        self._encoded.append(data)
+
+    def get(self, index: int):
+        """Decoded frame `index`, decoding it now if it isn't cached."""
+        entry = self._decoded.get(index)
+        if entry is not None:
+            self.hits += 1
+            self._decoded.move_to_end(index)
+            return entry[0]
+        self.misses += 1
+        return self._store(index, protect=(index,))
+
+    def prefetch(self, index: int):
+        """Decode the next few frames starting at `index` if missing."""
+        count = len(self._encoded)
+        if not count:
+            return
+        window = [(index + k) % count for k in range(min(self.lookahead, count))]
+        for i in window:
+            if i not in self._decoded:
+                self._store(i, protect=window)
+                self.prefetched += 1
+
+    def _store(self, index: int, protect):
+        image = self.decode(self._encoded[index])
+        size = self.sizeof(image)
+        self._decoded[index] = (image, size)
+        self.decoded_bytes += size
+        self._evict(protect)
+        return image
+
+    def _evict(self, protect):
+        # Oldest first; frames in the current window are kept even over budget
+        for index in list(self._decoded):
+            if self.decoded_bytes <= self.budget_bytes:
+                break
+            if index in protect:
+                continue
+            _, size = self._decoded.pop(index)
+            self.decoded_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "frames": len(self._encoded),
+            "decoded_frames": len(self._decoded),
+            "decoded_bytes": self.decoded_bytes,
+            "encoded_bytes": sum(len(data) for data in self._encoded),
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "prefetched": self.prefetched,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,130 @@
+"""
+Love Calculator App – lightweight latency metrics
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import functools
+import time
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with power-of-two microsecond buckets.
+    - Bucket b holds samples below 2**b microseconds
+    - Recording is O(1) and memory stays constant
+    Percentiles are reported as the upper edge of their bucket.
+    """
+
+    BUCKETS = 32  # up to ~35 minutes
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        micros = int(seconds * 1_000_000)
+        bucket = min(micros.bit_length(), self.BUCKETS - 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        """Approximate latency (seconds) below which pct % of samples fall."""
+        if not self.count:
+            return 0.0
+        wanted = self.count * pct / 100.0
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= wanted:
+                return min((1 << bucket) / 1_000_000, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Count, mean, p50/p90/p99 and max, in milliseconds."""
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": round(mean * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+# ----------------------------------------------------------------------
+# GUI PROFILER (OPT-IN)
+# ----------------------------------------------------------------------
+class UiProfiler:
+    """
+    Opt-in timing for a Tk app; nothing is wrapped unless it is created.
+    - instrument(obj, names) replaces those methods on the instance with
+      timed wrappers (do it before callbacks are bound to widgets)
+    - A probe every probe_ms measures event-loop lag (how late it runs)
+      and counts the after() callbacks Tk has pending
+    summary() gives per-method wall time, lag and pending-callback counts.
+    """
+
+    def __init__(self, widget, probe_ms: int = 50):
+        self.widget = widget
+        self.probe_ms = probe_ms
+        self.timings = {}
+        self.lag = LatencyHistogram()
+        self.pending_after = 0
+        self.max_pending_after = 0
+        self._probe_id = None
+        self._expected = None
+
+    def instrument(self, obj, names):
+        for name in names:
+            setattr(obj, name, self._timed(name, getattr(obj, name)))
+
+    def _timed(self, name, method):
+        hist = self.timings.setdefault(name, LatencyHistogram())
+        perf = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = perf()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                hist.record(perf() - start)
+
+        return timed
+
+    def start(self):
+        if self._probe_id is None:
+            self._expected = time.perf_counter() + self.probe_ms / 1000.0
+            self._probe_id = self.widget.after(self.probe_ms, self._probe)
+
+    def stop(self):
+        if self._probe_id is not None:
+            self.widget.after_cancel(self._probe_id)
+            self._probe_id = None
+
+    def _probe(self):
+        now = time.perf_counter()
+        self.lag.record(max(now - self._expected, 0.0))
+        tk_app = self.widget.tk
+        self.pending_after = len(tk_app.splitlist(tk_app.call("after", "info")))
+        self.max_pending_after = max(self.max_pending_after, self.pending_after)
+        self._expected = now + self.probe_ms / 1000.0
+        self._probe_id = self.widget.after(self.probe_ms, self._probe)
+
+    def summary(self) -> dict:
+        return {
+            "calls": {name: hist.summary() for name, hist in self.timings.items()},
+            "event_loop_lag": self.lag.summary(),
+            "pending_after": {"last": self.pending_after, "max": self.max_pending_after},
+        }
@@ -0,0 +1,117 @@
+"""
+Love Calculator App – multi-process sharded file scoring
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import mmap
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from love_stream import format_results, read_pairs, score_rows
+
+
+def plan_shards(path: str, shards: int):
+    """
+    Split a file into about `shards` byte ranges that end on line boundaries.
+    Returns a list of (start, end) offsets covering the whole file.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, shards):
+            newline = mm.find(b"\n", max(size * i // shards, bounds[-1]))
+            if newline == -1:
+                break
+            if newline + 1 > bounds[-1] and newline + 1 < size:
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _iter_lines(mm, start: int, end: int):
+    """Decoded lines of mm[start:end], one at a time."""
+    pos = start
+    while pos < end:
+        newline = mm.find(b"\n", pos, end)
+        stop = end if newline == -1 else newline + 1
+        yield mm[pos:stop].decode("utf-8")
+        pos = stop
+
+
+def _count_lines(mm, end: int) -> int:
+    """Newlines in mm[:end], counted a block at a time."""
+    block = 1 << 20
+    return sum(mm[pos:min(pos + block, end)].count(b"\n") for pos in range(0, end, block))
+
+
+def _score_shard(path, start, end, in_fmt, out_fmt, out_path, chunk_size, keep_header):
+    """Worker: score one byte range through mmap into its own output file."""
+    count = 0
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        rows = score_rows(read_pairs(_iter_lines(mm, start, end), in_fmt), chunk_size)
+        lines = format_results(rows, out_fmt)
+        try:
+            with open(out_path, "w", encoding="utf-8", newline="") as out:
+                if out_fmt == "csv":
+                    header = next(lines)
+                    if keep_header:
+                        out.write(header)
+                for line in lines:
+                    out.write(line)
+                    count += 1
+        except ValueError:
+            if start == 0:
+                raise
+            # The error counted lines from the start of the shard. Lines before
+            # it are only counted now, on the error path: read the shard again
+            # so the error names the line of the input file.
+            first_line = _count_lines(mm, start) + 1
+            for _ in read_pairs(_iter_lines(mm, start, end), in_fmt, first_line):
+                pass
+            raise
+    return count
+
+
+def score_file_parallel(path, out, in_fmt, out_fmt, workers, chunk_size=4096):
+    """
+    Score a large pairs file with a process pool.
+    - The file is split into byte-range shards at line boundaries
+    - Each worker reads its shard through mmap and writes its own part file
+    - Part files are appended to `out` (a binary stream) in input order
+    CSV input must not contain quoted fields spanning several lines.
+    Returns the number of rows scored.
+    """
+    shards = plan_shards(path, workers)
+    if not shards:
+        if out_fmt == "csv":
+            out.write(next(format_results(iter(()), out_fmt)).encode("utf-8"))
+        return 0
+
+    part_dir = tempfile.mkdtemp(prefix="love_shards_")
+    try:
+        part_paths = [os.path.join(part_dir, f"part-{i:05d}") for i in range(len(shards))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _score_shard, path, start, end, in_fmt, out_fmt,
+                    part_path, chunk_size, i == 0,
+                )
+                for i, ((start, end), part_path) in enumerate(zip(shards, part_paths))
+            ]
+            counts = [future.result() for future in futures]
+
+        for part_path in part_paths:
+            with open(part_path, "rb") as part:
+                shutil.copyfileobj(part, out, 1 << 20)
+        return sum(counts)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
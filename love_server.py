@@ -0,0 +1,218 @@
+"""
+Love Calculator App – local HTTP scoring service
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+from love_core import (
+    VERDICT_MESSAGES,
+    ZODIAC_MESSAGES,
+    PairCache,
+    _batch_numpy,
+    score_pair,
+    score_pairs_batch_codes,
+)
+from love_metrics import LatencyHistogram
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MISSING_NAMES = "Please enter both names."
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+# ----------------------------------------------------------------------
+# RESULTS
+# ----------------------------------------------------------------------
+def _pair_fields(record):
+    """(name1, name2, sign1, sign2) from a JSON object / query dict, stripped."""
+    if not isinstance(record, dict):
+        raise ValueError("each pair must be a JSON object")
+    return tuple(str(record.get(field) or "").strip() for field in ("name1", "name2", "sign1", "sign2"))
+
+
+def _result(base, bonus, final, verdict_code, zodiac_msg_id) -> dict:
+    """Same values on_calculate_clicked shows for a pair."""
+    return {
+        "base_score": int(base),
+        "zodiac_bonus": int(bonus),
+        "final_score": int(final),
+        "verdict": VERDICT_MESSAGES[verdict_code],
+        "zodiac_message": ZODIAC_MESSAGES[zodiac_msg_id],
+    }
+
+
+def score_one(record, cache=None) -> dict:
+    """Single-pair endpoint; repeated pairs are answered from `cache` if given."""
+    name1, name2, sign1, sign2 = _pair_fields(record)
+    if not name1 or not name2:
+        raise ValueError(MISSING_NAMES)
+    if cache is not None:
+        return _result(*cache.lookup(name1, name2, sign1, sign2)[:5])
+    return _result(*score_pair(name1, name2, sign1, sign2))
+
+
+def score_many(records) -> list:
+    """Batch endpoint: one result (or error) per input pair, in order."""
+    rows = [_pair_fields(record) for record in records]
+    valid = [i for i, row in enumerate(rows) if row[0] and row[1]]
+    results = [{"error": MISSING_NAMES}] * len(rows)
+    if valid:
+        columns = score_pairs_batch_codes(*zip(*(rows[i] for i in valid)))
+        for pos, row in enumerate(valid):
+            results[row] = _result(*(column[pos] for column in columns))
+    return results
+
+
+# ----------------------------------------------------------------------
+# HTTP SERVER
+# ----------------------------------------------------------------------
+class ScoringServer:
+    """
+    Minimal asyncio HTTP/1.1 server for the scoring logic.
+    - GET/POST /score   one pair (query string or JSON object)
+    - POST /batch       JSON list of pairs (or {"pairs": [...]})
+    - GET /stats        per-endpoint latency histograms
+    Connections are kept alive and pipelined requests are answered in order.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, cache_size: int = 4096):
+        self.host = host
+        self.port = port
+        # /score results for popular pairs (cache_size=0 turns it off)
+        self.cache = PairCache(maxsize=cache_size)
+        self.histograms = {"/score": LatencyHistogram(), "/batch": LatencyHistogram()}
+        self.started = time.time()
+
+    async def serve_forever(self):
+        # Import NumPy (if installed) before accepting connections, not
+        # inside the first /batch request where it would stall the loop
+        _batch_numpy()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                start = time.perf_counter()
+
+                try:
+                    method, target, version, headers = self._parse_head(head)
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    writer.write(self._response(400, {"error": "malformed request"}, keep_alive=False))
+                    break
+
+                keep_alive = self._keep_alive(version, headers)
+                if length < 0 or length > MAX_BODY_BYTES:
+                    writer.write(self._response(413, {"error": "body too large"}, keep_alive=False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                path, status, payload = self.dispatch(method, target, body)
+                writer.write(self._response(status, payload, keep_alive))
+
+                histogram = self.histograms.get(path)
+                if histogram is not None:
+                    histogram.record(time.perf_counter() - start)
+
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, method: str, target: str, body: bytes):
+        """Route one request. Returns (path, status, JSON payload)."""
+        url = urlsplit(target)
+        path = url.path
+        try:
+            if path == "/score":
+                if method == "GET":
+                    return path, 200, score_one(dict(parse_qsl(url.query)), self.cache)
+                if method == "POST":
+                    return path, 200, score_one(json.loads(body or b"{}"), self.cache)
+                return path, 405, {"error": "use GET or POST"}
+            if path == "/batch":
+                if method != "POST":
+                    return path, 405, {"error": "use POST"}
+                records = json.loads(body or b"[]")
+                if isinstance(records, dict):
+                    records = records.get("pairs", [])
+                if not isinstance(records, list):
+                    raise ValueError("expected a JSON list of pairs")
+                return path, 200, {"results": score_many(records)}
+            if path == "/stats":
+                return path, 200, self.stats()
+        except ValueError as exc:
+            # json.JSONDecodeError is a ValueError too
+            return path, 400, {"error": str(exc)}
+        return path, 404, {"error": "not found"}
+
+    def stats(self) -> dict:
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "latency": {path: h.summary() for path, h in self.histograms.items()},
+            "cache": self.cache.stats(),
+        }
+
+    @staticmethod
+    def _parse_head(head: bytes):
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    def _keep_alive(version: str, headers: dict) -> bool:
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    @staticmethod
+    def _response(status: int, payload, keep_alive: bool) -> bytes:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        return head.encode("latin-1") + body
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8765, cache_size: int = 4096) -> ScoringServer:
+    """Run the scoring service until interrupted; returns it for its stats."""
+    server = ScoringServer(host, port, cache_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return server
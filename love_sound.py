@@ -0,0 +1,185 @@
+"""
+Love Calculator App – sound effects
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import collections
+import threading
+import time
+
+# Sound name -> beeps as (frequency Hz, duration ms)
+SOUNDS = {
+    # Simple pleasant beep
+    "success": ((900, 150), (1200, 150)),
+    "error": ((300, 250),),
+}
+
+
+# ----------------------------------------------------------------------
+# BACKENDS
+# ----------------------------------------------------------------------
+class WinsoundBackend:
+    """Beeps through winsound (Windows only)."""
+
+    def __init__(self):
+        import winsound
+
+        self._beep = winsound.Beep
+
+    def play(self, name: str, tones):
+        for frequency, duration in tones:
+            self._beep(frequency, duration)
+
+
+class NullBackend:
+    """Plays nothing (used where winsound is not available)."""
+
+    def play(self, name: str, tones):
+        pass
+
+
+class RecordingBackend:
+    """
+    Records what would have been played, for testing without a sound card.
+    - played: [(name, start, end), ...] with time.monotonic() timestamps
+    - simulate=True sleeps for the sounds' duration, like a real beep
+    """
+
+    def __init__(self, simulate: bool = False):
+        self.simulate = simulate
+        self.played = []
+
+    def play(self, name: str, tones):
+        start = time.monotonic()
+        if self.simulate:
+            time.sleep(sum(duration for _, duration in tones) / 1000.0)
+        self.played.append((name, start, time.monotonic()))
+
+
+def default_backend():
+    try:
+        return WinsoundBackend()
+    except ImportError:
+        return NullBackend()
+
+
+# ----------------------------------------------------------------------
+# PLAYER (WORKER THREAD)
+# ----------------------------------------------------------------------
+class SoundPlayer:
+    """
+    Plays sounds on a worker thread so the Tk thread never waits on a beep.
+    - play(name) returns at once
+    - A sound already waiting in the queue is not queued again, so a burst
+      of clicks plays it once
+    - At most `maxsize` sounds wait; extra requests are dropped
+    The worker thread starts with the first sound.
+    """
+
+    def __init__(self, backend=None, maxsize: int = 2):
+        self.backend = backend if backend is not None else default_backend()
+        self.maxsize = maxsize
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = None
+
+    def play(self, name: str) -> bool:
+        """Queue a sound; False if it was merged into a queued one or dropped."""
+        with self._cond:
+            if self._closed:
+                return False
+            if name in self._queue:
+                self.coalesced += 1
+                return False
+            if len(self._queue) >= self.maxsize:
+                self.dropped += 1
+                return False
+            self._queue.append(name)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sound-player", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def wait_idle(self, timeout=None) -> bool:
+        """Wait until every queued sound has been played."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        """Stop the worker after the sound that is playing (queued ones are skipped)."""
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self) -> dict:
+        return {
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "queued": len(self._queue),
+        }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                name = self._queue.popleft()
+                self._busy = True
+            try:
+                self.backend.play(name, SOUNDS[name])
+            except RuntimeError:
+                # winsound raises RuntimeError when the beep can't be played
+                pass
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self.played += 1
+                    self._cond.notify_all()
+
+
+_player = None
+
+
+def get_player() -> SoundPlayer:
+    """The shared player used by play_success_sound / play_error_sound."""
+    global _player
+    if _player is None:
+        _player = SoundPlayer()
+    return _player
+
+
+def set_sound_backend(backend):
+    """Replace the shared player's backend (e.g. a RecordingBackend)."""
+    get_player().backend = backend
+
+
+def play_success_sound():
+    get_player().play("success")
+
+
+def play_error_sound():
+    get_player().play("error")
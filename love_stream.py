@@ -0,0 +1,120 @@
+"""
+Love Calculator App – streaming pair scoring (JSONL / CSV)
+Copyright (c) 2025 Aravindkumar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to use,
+modify, and distribute copies of the Software, provided that this header
+remains intact and credit is given to the original author: Aravindkumar.
+"""
+
+import csv
+import json
+
+from love_core import VERDICT_MESSAGES, score_pairs_batch_codes
+
+INPUT_FIELDS = ("name1", "name2", "sign1", "sign2")
+RESULT_FIELDS = INPUT_FIELDS + ("base_score", "zodiac_bonus", "final_score", "verdict")
+
+
+def read_pairs(stream, fmt: str, first_line: int = 1):
+    """
+    Yield (name1, name2, sign1, sign2) rows from a JSONL or CSV stream.
+    - JSONL: one object with name1/name2/sign1/sign2 keys (or a list) per line
+    - CSV: columns in that order; a header row with those names is skipped
+    Missing fields are read as empty strings. `first_line` is the line
+    number of the stream's first line in its file (for a shard of a file),
+    used in error messages.
+    """
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, first_line):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"line {line_no}: invalid JSON ({exc})") from None
+            if isinstance(record, dict):
+                values = [record.get(field) for field in INPUT_FIELDS]
+            elif isinstance(record, list):
+                values = record[:4] + [None] * (4 - len(record))
+            else:
+                raise ValueError(f"line {line_no}: expected an object or a list")
+            yield tuple("" if value is None else str(value) for value in values)
+    else:
+        reader = csv.reader(stream)
+        for row in _csv_rows(reader, first_line):
+            if not row:
+                continue
+            if first_line + reader.line_num == 2 and [c.strip().lower() for c in row[:2]] == ["name1", "name2"]:
+                continue
+            row = row[:4] + [""] * (4 - len(row))
+            yield tuple(row)
+
+
+def _csv_rows(reader, first_line: int = 1):
+    """Rows of a csv.reader; a malformed line is a ValueError, like bad JSONL."""
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as exc:
+            raise ValueError(f"line {first_line - 1 + reader.line_num}: {exc}") from None
+        yield row
+
+
+def _chunked(rows, size: int):
+    """Group an iterator into lists of at most `size` rows."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def score_rows(rows, chunk_size: int = 4096):
+    """
+    Score a stream of (name1, name2, sign1, sign2) rows chunk by chunk.
+    Yields (name1, name2, sign1, sign2, base, bonus, final, verdict_code);
+    only one chunk is held in memory at a time.
+    """
+    for chunk in _chunked(rows, chunk_size):
+        names1, names2, signs1, signs2 = zip(*chunk)
+        base, bonus, final, verdicts, _ = score_pairs_batch_codes(names1, names2, signs1, signs2)
+        for row, b, z, f, v in zip(chunk, base, bonus, final, verdicts):
+            yield row + (int(b), int(z), int(f), int(v))
+
+
+def format_results(results, fmt: str):
+    """Yield output lines (JSONL or CSV) for scored rows."""
+    if fmt == "jsonl":
+        for *values, verdict in results:
+            record = dict(zip(RESULT_FIELDS, values))
+            record["verdict"] = VERDICT_MESSAGES[verdict]
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+    else:
+        buffer = _LineBuffer()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(RESULT_FIELDS)
+        yield buffer.pop()
+        for *values, verdict in results:
+            writer.writerow(values + [VERDICT_MESSAGES[verdict]])
+            yield buffer.pop()
+
+
+class _LineBuffer:
+    """Minimal file-like target so csv.writer can feed a generator."""
+
+    def __init__(self):
+        self._line = ""
+
+    def write(self, text):
+        self._line += text
+
+    def pop(self):
+        line, self._line = self._line, ""
+        return line
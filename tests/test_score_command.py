@@ -0,0 +1,37 @@
+"""`score` subcommand: bad input is reported as `error: line N: ...` with rc=1."""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from love_calculator_app import main
+
+
+class ScoreCommandErrorTest(unittest.TestCase):
+    def _score(self, text, suffix, *extra):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pairs" + suffix)
+            with open(path, "w", encoding="utf-8", newline="") as fh:
+                fh.write(text)
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                rc = main(["score", path, *extra])
+        return rc, stderr.getvalue()
+
+    def test_csv_field_over_limit(self):
+        text = "name1,name2\nAlice,Bob\n" + "x" * (csv.field_size_limit() + 1) + ",Bob\n"
+        rc, err = self._score(text, ".csv")
+        self.assertEqual(rc, 1)
+        self.assertTrue(err.startswith("error: line 3: field larger than field limit"), err)
+
+    def test_invalid_jsonl(self):
+        rc, err = self._score('{"name1": "Alice", "name2": "Bob"}\n{oops\n', ".jsonl")
+        self.assertEqual(rc, 1)
+        self.assertTrue(err.startswith("error: line 2: invalid JSON"), err)
+
+
+if __name__ == "__main__":
+    unittest.main()